@@ -2,28 +2,29 @@ import sys
 import json
 import sqlite3
 import base64
+import gzip
 import math
+import threading
 from datetime import datetime, timedelta
+from itertools import groupby, islice, starmap
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 import uuid
 
 try:
-    from geopy.distance import distance
+    import ijson  # 선택 의존성: 설치되어 있으면 GeoJSON을 피처 단위로 스트리밍 파싱
 except ImportError:
-    import subprocess
-
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "geopy"])
-    from geopy.distance import distance
+    ijson = None
 
 try:
-    import mgrs
+    import orjson  # 선택 의존성: 설치되어 있으면 대용량 JSON 파싱/직렬화에 사용
 except ImportError:
-    import subprocess
-
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "mgrs"])
-    import mgrs
+    orjson = None
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -31,8 +32,8 @@ from PyQt5.QtWidgets import (
     QTabWidget, QDialog, QLineEdit, QSpinBox, QDialogButtonBox,
     QMessageBox, QFileDialog, QComboBox, QFormLayout
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, pyqtSlot, pyqtProperty
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEngineProfile
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer, pyqtSlot, pyqtProperty, QUrl, QThreadPool, QRunnable, QStandardPaths
 from PyQt5.QtGui import QFont
 from PyQt5.QtWebChannel import QWebChannel
 
@@ -62,7 +63,21 @@ plugin_loader = get_plugin_loader(localization_manager)
 # 데이터 모델
 # ============================================================================
 
-@dataclass
+# 저장/전송 시 좌표 반올림 자릿수 (위경도 7자리 ≈ 1.1cm). None이면 반올림하지 않음 (측량급 데이터용)
+COORD_DECIMALS = 7
+ALT_DECIMALS = 2
+
+
+def quantize(value, decimals):
+    """decimals가 None이 아니면 해당 자릿수로 반올림"""
+    return value if decimals is None or value is None else round(value, decimals)
+
+
+# Python 3.10+에서는 __slots__ 기반 dataclass 사용 (인스턴스 메모리 절감)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Waypoint:
     lat: float
     lon: float
@@ -74,27 +89,45 @@ class Waypoint:
     distance: float = 0.0  # Distance from previous waypoint in km
     name: str = None  # Waypoint name (can use NATO phonetic or custom)
 
+    # to_dict 직렬화 필드 순서 (어노테이션이 없으므로 dataclass 필드가 아님)
+    FIELDS = ('lat', 'lon', 'alt', 'task_code', 'wp_id', 'speed', 'eta', 'distance', 'name')
+
     def __post_init__(self):
         if self.wp_id is None:
             self.wp_id = str(uuid.uuid4())[:8]
         if self.name is None:
             self.name = ""
 
+    @property
+    def mgrs(self) -> str:
+        """현재 좌표의 MGRS 문자열 (좌표를 키로 하는 변환 캐시를 사용하므로 좌표가 바뀌면 자동으로 새 값)"""
+        return MGRSConverter.lat_lon_to_mgrs(self.lat, self.lon)
+
     def to_dict(self):
-        return {
-            'lat': self.lat,
-            'lon': self.lon,
-            'alt': self.alt,
-            'task_code': self.task_code,
-            'wp_id': self.wp_id,
-            'speed': self.speed,
-            'eta': self.eta,
-            'distance': self.distance,
-            'name': self.name
-        }
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data['lat'] = quantize(self.lat, COORD_DECIMALS)
+        data['lon'] = quantize(self.lon, COORD_DECIMALS)
+        data['alt'] = quantize(self.alt, ALT_DECIMALS)
+        return data
+
+    def to_wire(self) -> list:
+        """지도(JS) 전송용 압축 표현: [wp_id, lat, lon, alt, task, speed, distance, name]
 
+        task는 MilitarySymbolGenerator.TASK_CODES의 인덱스 (미등록 코드는 문자열 그대로)
+        """
+        return [
+            self.wp_id,
+            quantize(self.lat, COORD_DECIMALS),
+            quantize(self.lon, COORD_DECIMALS),
+            quantize(self.alt, ALT_DECIMALS),
+            MilitarySymbolGenerator.TASK_INDEX.get(self.task_code, self.task_code),
+            self.speed,
+            self.distance,
+            self.name,
+        ]
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Mission:
     mission_id: str
     mission_name: str
@@ -108,159 +141,272 @@ class Mission:
         if self.last_saved_at is None:
             self.last_saved_at = self.created_at
 
+    def totals(self):
+        """총 거리(km)와 평균 속도(km/h) 계산: (total_distance, avg_speed)"""
+        waypoints = self.waypoints
+        # 내장 sum으로 합산 (Python 수준 루프 없이 C에서 누적)
+        total_distance = sum(map(attrgetter('distance'), waypoints), 0.0)
+        count = len(waypoints)
+        return total_distance, (sum(map(attrgetter('speed'), waypoints), 0.0) / count if count else 0)
+
 
 # ============================================================================
 # 데이터베이스
 # ============================================================================
 
 class MissionDatabase:
+    # 자주 사용하는 SQL 문 (동일한 문자열을 재사용하여 sqlite3 statement 캐시 적중)
+    SQL_UPSERT_MISSION = (
+        "INSERT OR REPLACE INTO missions (mission_id, mission_name, created_at, updated_at) VALUES (?, ?, ?, ?)"
+    )
+    SQL_DELETE_WAYPOINTS = "DELETE FROM waypoints WHERE mission_id = ?"
+    SQL_INSERT_WAYPOINT = (
+        "INSERT INTO waypoints (wp_id, mission_id, lat, lon, alt, task_code, sequence_order, speed, eta, name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    SQL_SELECT_MISSIONS_JOIN = (
+        "SELECT m.mission_id, m.mission_name, m.created_at, w.wp_id, w.lat, w.lon, w.alt, w.task_code, w.speed, w.eta, w.name "
+        "FROM missions m LEFT JOIN waypoints w ON w.mission_id = m.mission_id "
+        "ORDER BY m.mission_id, w.sequence_order"
+    )
+
+    SCHEMA_VERSION = 3
+
     def __init__(self, db_path: str = "missions.db"):
         self.db_path = db_path
+        # 연결은 한 번만 열고 재사용 (WAL 모드)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=30000;
+            PRAGMA cache_size=-65536;
+        """)
         self.init_db()
 
-    def init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # 기존 테이블 생성 코드
-        cursor.execute("""
-                       CREATE TABLE IF NOT EXISTS missions
-                       (
-                           mission_id
-                           TEXT
-                           PRIMARY
-                           KEY,
-                           mission_name
-                           TEXT
-                           NOT
-                           NULL,
-                           created_at
-                           TIMESTAMP,
-                           updated_at
-                           TIMESTAMP
-                       )
-                       """)
-
-        cursor.execute("""
-                       CREATE TABLE IF NOT EXISTS waypoints
-                       (
-                           wp_id
-                           TEXT
-                           PRIMARY
-                           KEY,
-                           mission_id
-                           TEXT
-                           NOT
-                           NULL,
-                           lat
-                           REAL
-                           NOT
-                           NULL,
-                           lon
-                           REAL
-                           NOT
-                           NULL,
-                           alt
-                           REAL,
-                           task_code
-                           TEXT,
-                           sequence_order
-                           INTEGER,
-                           speed
-                           REAL
-                           DEFAULT
-                           50.0,
-                           eta
-                           TEXT,
-                           name
-                           TEXT,
-                           FOREIGN
-                           KEY
-                       (
-                           mission_id
-                       ) REFERENCES missions
-                       (
-                           mission_id
-                       )
-                           )
-                       """)
+    def close(self):
+        """데이터베이스 연결 종료"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
 
-        # 마이그레이션: speed 및 eta 열 추가
-        try:
-            cursor.execute("ALTER TABLE waypoints ADD COLUMN speed REAL DEFAULT 50.0")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute("ALTER TABLE waypoints ADD COLUMN eta TEXT")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute("ALTER TABLE waypoints ADD COLUMN name TEXT")
-        except sqlite3.OperationalError:
-            pass
+    def init_db(self):
+        """스키마 생성/마이그레이션 (PRAGMA user_version으로 필요한 단계만 실행)"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
 
-        conn.commit()
-        conn.close()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            self._migrate(cursor, version)
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _migrate(self, cursor, version: int):
+        if version < 1:
+            # 기존 테이블 생성 코드
+            cursor.execute("""
+                           CREATE TABLE IF NOT EXISTS missions
+                           (
+                               mission_id
+                               TEXT
+                               PRIMARY
+                               KEY,
+                               mission_name
+                               TEXT
+                               NOT
+                               NULL,
+                               created_at
+                               TIMESTAMP,
+                               updated_at
+                               TIMESTAMP
+                           )
+                           """)
+
+            cursor.execute("""
+                           CREATE TABLE IF NOT EXISTS waypoints
+                           (
+                               wp_id
+                               TEXT
+                               PRIMARY
+                               KEY,
+                               mission_id
+                               TEXT
+                               NOT
+                               NULL,
+                               lat
+                               REAL
+                               NOT
+                               NULL,
+                               lon
+                               REAL
+                               NOT
+                               NULL,
+                               alt
+                               REAL,
+                               task_code
+                               TEXT,
+                               sequence_order
+                               INTEGER,
+                               speed
+                               REAL
+                               DEFAULT
+                               50.0,
+                               eta
+                               TEXT,
+                               name
+                               TEXT,
+                               FOREIGN
+                               KEY
+                           (
+                               mission_id
+                           ) REFERENCES missions
+                           (
+                               mission_id
+                           )
+                               )
+                           """)
+
+        if version < 2:
+            # 마이그레이션: speed 및 eta 열 추가 (이전 DB에는 일부 열이 이미 존재할 수 있음)
+            try:
+                cursor.execute("ALTER TABLE waypoints ADD COLUMN speed REAL DEFAULT 50.0")
+            except sqlite3.OperationalError:
+                pass
+            try:
+                cursor.execute("ALTER TABLE waypoints ADD COLUMN eta TEXT")
+            except sqlite3.OperationalError:
+                pass
+            try:
+                cursor.execute("ALTER TABLE waypoints ADD COLUMN name TEXT")
+            except sqlite3.OperationalError:
+                pass
+
+        if version < 3:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_wp_mission_seq ON waypoints(mission_id, sequence_order)")
 
     def save_mission(self, mission: Mission):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         mission.last_saved_at = datetime.now().isoformat()
 
-        cursor.execute(
-            "INSERT OR REPLACE INTO missions (mission_id, mission_name, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (mission.mission_id, mission.mission_name, mission.created_at, mission.last_saved_at)
-        )
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
 
-        cursor.execute("DELETE FROM waypoints WHERE mission_id = ?", (mission.mission_id,))
-
-        for i, wp in enumerate(mission.waypoints):
             cursor.execute(
-                "INSERT INTO waypoints (wp_id, mission_id, lat, lon, alt, task_code, sequence_order, speed, eta, name) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (wp.wp_id, mission.mission_id, wp.lat, wp.lon, wp.alt, wp.task_code, i, wp.speed, wp.eta, wp.name)
+                self.SQL_UPSERT_MISSION,
+                (mission.mission_id, mission.mission_name, mission.created_at, mission.last_saved_at)
             )
 
-        conn.commit()
-        conn.close()
+            cursor.execute(self.SQL_DELETE_WAYPOINTS, (mission.mission_id,))
+
+            rows = [
+                (wp.wp_id, mission.mission_id, quantize(wp.lat, COORD_DECIMALS), quantize(wp.lon, COORD_DECIMALS),
+                 wp.alt, wp.task_code, i, wp.speed, wp.eta, wp.name)
+                for i, wp in enumerate(mission.waypoints)
+            ]
+            cursor.executemany(self.SQL_INSERT_WAYPOINT, rows)
 
         # Emit signal to update UI
         if hasattr(self, 'mission_updated'):
             self.mission_updated.emit(mission)
 
-    def load_missions(self) -> List[Mission]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def load_missions(self, conn: Optional[sqlite3.Connection] = None) -> List[Mission]:
+        """저장된 미션 목록 조회 (conn을 주면 그 연결로 읽음; 작업 스레드는 별도 읽기 연결을 사용)"""
+        cursor = (conn or self.conn).cursor()
 
-        cursor.execute("SELECT mission_id, mission_name, created_at FROM missions")
+        # 미션과 웨이포인트를 한 번의 쿼리로 조회 (N+1 방지)
+        cursor.execute(self.SQL_SELECT_MISSIONS_JOIN)
         missions = []
 
-        for mission_id, mission_name, created_at in cursor.fetchall():
-            cursor.execute(
-                "SELECT wp_id, lat, lon, alt, task_code, speed, eta, name FROM waypoints WHERE mission_id = ? ORDER BY sequence_order",
-                (mission_id,)
-            )
-
+        for (mission_id, mission_name, created_at), rows in groupby(cursor.fetchall(), key=lambda r: r[:3]):
             waypoints = []
-            for row in cursor.fetchall():
-                speed_val = row[5] if len(row) > 5 and row[5] is not None else 50.0
-                eta_val = row[6] if len(row) > 6 else None
-                name_val = row[7] if len(row) > 7 else ""
+            for row in rows:
+                if row[3] is None:  # 웨이포인트가 없는 미션
+                    continue
+                speed_val = row[8] if row[8] is not None else 50.0
                 waypoints.append(
-                    Waypoint(lat=row[1], lon=row[2], alt=row[3], task_code=row[4], wp_id=row[0], speed=speed_val,
-                             eta=eta_val, name=name_val))
+                    Waypoint(lat=row[4], lon=row[5], alt=row[6], task_code=row[7], wp_id=row[3], speed=speed_val,
+                             eta=row[9], name=row[10]))
 
             mission = Mission(mission_id, mission_name, waypoints, created_at)
             missions.append(mission)
 
-        conn.close()
         return missions
 
 
+# ============================================================================
+# 거리 계산
+# ============================================================================
+
+EARTH_RADIUS_KM = 6371.0088  # 평균 지구 반경 (IUGG)
+
+
+def leg_distances_km(lats, lons) -> List[float]:
+    """연속한 좌표 사이의 구간 거리(km)를 haversine 공식으로 한 번에 계산합니다."""
+    rad_lats = list(map(math.radians, lats))
+    rad_lons = list(map(math.radians, lons))
+    cos_lats = list(map(math.cos, rad_lats))
+    sin, asin, sqrt = math.sin, math.asin, math.sqrt
+
+    # 인접 구간을 zip으로 한 번에 순회 (인덱스 접근/append 없이 단일 컴프리헨션)
+    return [
+        2 * EARTH_RADIUS_KM * asin(sqrt(min(
+            1.0, sin((lat1 - lat0) / 2) ** 2 + cos0 * cos1 * sin((lon1 - lon0) / 2) ** 2
+        )))
+        for lat0, lat1, lon0, lon1, cos0, cos1 in zip(
+            rad_lats, islice(rad_lats, 1, None),
+            rad_lons, islice(rad_lons, 1, None),
+            cos_lats, islice(cos_lats, 1, None),
+        )
+    ]
+
+
 # ============================================================================
 # MGRS 좌표 변환
 # ============================================================================
 
+_MGRS = None  # 변환기 인스턴스는 처음 사용할 때 한 번만 생성하여 재사용
+# mgrs 패키지(GEOTRANS ctypes 래퍼)는 UTM 존 등 변환 파라미터를 C 전역 변수에 두고,
+# ctypes 호출 중에는 GIL이 해제되므로 모든 변환과 초기화를 이 잠금으로 직렬화한다.
+_MGRS_LOCK = threading.Lock()
+
+
+def _get_mgrs():
+    """mgrs 모듈을 지연 로드하여 변환기 인스턴스를 반환 (시작 시간 단축, 스레드 안전)"""
+    global _MGRS
+    if _MGRS is None:
+        with _MGRS_LOCK:
+            if _MGRS is None:
+                try:
+                    import mgrs
+                except ImportError:
+                    import subprocess
+
+                    subprocess.check_call([sys.executable, "-m", "pip", "install", "mgrs"])
+                    import mgrs
+                _MGRS = mgrs.MGRS()
+    return _MGRS
+
+
+def _to_mgrs(lat: float, lon: float, precision: int = 5) -> str:
+    """위경도 → MGRS 변환 (_MGRS_LOCK으로 직렬화, 모든 toMGRS 호출은 이 함수를 거친다)"""
+    converter = _get_mgrs()
+    with _MGRS_LOCK:
+        return converter.toMGRS(lat, lon, MGRSPrecision=precision)
+
+
+def _to_lat_lon(mgrs_str: str) -> tuple:
+    """MGRS → 위경도 변환 (_MGRS_LOCK으로 직렬화)"""
+    converter = _get_mgrs()
+    with _MGRS_LOCK:
+        return converter.toLatLon(mgrs_str)
+
+
+@lru_cache(maxsize=4096)
+def _lat_lon_to_mgrs_cached(lat: float, lon: float) -> str:
+    return _to_mgrs(lat, lon)
+
+
 class MGRSConverter:
     """MGRS (Military Grid Reference System) 좌표 변환"""
 
@@ -268,9 +414,7 @@ class MGRSConverter:
     def lat_lon_to_mgrs(lat: float, lon: float) -> str:
         """Convert latitude/longitude to MGRS."""
         try:
-            m = mgrs.MGRS()
-            mgrs_str = m.toMGRS(lat, lon, MGRSPrecision=5)
-            return mgrs_str
+            return _lat_lon_to_mgrs_cached(round(lat, 7), round(lon, 7))
         except Exception as e:
             return f"Error: {str(e)}"
 
@@ -278,8 +422,7 @@ class MGRSConverter:
     def mgrs_to_lat_lon(mgrs_str: str) -> tuple:
         """Convert MGRS to latitude/longitude."""
         try:
-            m = mgrs.MGRS()
-            lat, lon = m.toLatLon(mgrs_str)
+            lat, lon = _to_lat_lon(mgrs_str)
             return (lat, lon)
         except Exception as e:
             return (None, None)
@@ -289,6 +432,16 @@ class MGRSConverter:
 # NATO 포네틱 코드 변환
 # ============================================================================
 
+class _PhoneticTranslationTable(dict):
+    """str.translate용 변환 테이블 (미등록 문자는 숫자만 유지하고 나머지는 제거)"""
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = char + '\0' if char.isdigit() else None
+        self[code] = value
+        return value
+
+
 class NATOPhoneticConverter:
     PHONETIC_ALPHABET = {
         'A': 'Alpha', 'B': 'Bravo', 'C': 'Charlie', 'D': 'Delta',
@@ -303,27 +456,38 @@ class NATOPhoneticConverter:
     @staticmethod
     def to_phonetic(text: str) -> str:
         """Convert text to NATO phonetic alphabet."""
-        result = []
-        for char in text.upper():
-            if char in NATOPhoneticConverter.PHONETIC_ALPHABET:
-                result.append(NATOPhoneticConverter.PHONETIC_ALPHABET[char])
-            elif char == ' ':
-                result.append(' ')
-            elif char.isdigit():
-                result.append(char)
-        return ' '.join(result)
+        # 각 토큰 뒤에 '\0' 구분자를 붙여 한 번에 변환한 뒤 공백으로 치환
+        translated = text.upper().translate(NATOPhoneticConverter.PHONETIC_TABLE)
+        return translated[:-1].replace('\0', ' ')
 
     @staticmethod
     def get_phonetic_for_index(index: int) -> str:
         """Get phonetic code for waypoint index (A, B, C, ... Z, AA, AB, ...)."""
-        result = ""
+        if 0 <= index < len(NATOPhoneticConverter.PHONETIC_LABELS):
+            return NATOPhoneticConverter.PHONETIC_LABELS[index]
+        return NATOPhoneticConverter._build_phonetic_label(index)
+
+    @staticmethod
+    def _build_phonetic_label(index: int) -> str:
+        parts = []
         index += 1  # 1-based indexing
         while index > 0:
             index -= 1
-            result = NATOPhoneticConverter.PHONETIC_ALPHABET[chr(ord('A') + (index % 26))] + (
-                ' ' + result if result else '')
+            parts.append(NATOPhoneticConverter.PHONETIC_ALPHABET[chr(ord('A') + (index % 26))])
             index //= 26
-        return result.strip()
+        return ' '.join(reversed(parts))
+
+
+# to_phonetic용 변환 테이블 (문자 -> 포네틱 토큰 + '\0' 구분자)
+NATOPhoneticConverter.PHONETIC_TABLE = _PhoneticTranslationTable(
+    {ord(char): word + '\0' for char, word in NATOPhoneticConverter.PHONETIC_ALPHABET.items()}
+)
+NATOPhoneticConverter.PHONETIC_TABLE[ord(' ')] = ' \0'
+
+# A ~ ZZ (702개) 라벨을 미리 계산
+NATOPhoneticConverter.PHONETIC_LABELS = [
+    NATOPhoneticConverter._build_phonetic_label(i) for i in range(26 + 26 ** 2)
+]
 
 
 class MilitarySymbolGenerator:
@@ -341,107 +505,393 @@ class MilitarySymbolGenerator:
         'MEDEVAC': '#ffffff',  # White
     }
 
+    # 지도 전송 시 작업 코드를 작은 정수로 표현하기 위한 테이블
+    TASK_CODES = list(COLORS)
+    TASK_INDEX = {code: i for i, code in enumerate(TASK_CODES)}
+
+    # 군사 기호 SVG 템플릿 (create_svg에서 선택된 항목만 format)
+    SVG_TEMPLATES = {
+        'RECON': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <line x1="{padding}" y1="{padding}" x2="{far}" y2="{far}" stroke="#121212" stroke-width="2"/>
+            </svg>
+        """,
+        'STRIKE': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <polygon points="{center},{padding} {far},{center} {center},{far} {padding},{center}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{c_m5},{c_m5} L{c_p5},{c_p5} M{c_p5},{c_m5} L{c_m5},{c_p5}" stroke="#121212" stroke-width="3"/>
+            </svg>
+        """,
+        'RALLY': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" rx="2" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <circle cx="{center}" cy="{center}" r="4" fill="#121212"/>
+            </svg>
+        """,
+        'LANDING': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <circle cx="{center}" cy="{center}" r="{half}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{c_m8},{c_p4} L{center},{c_m8} L{c_p8},{c_p4}" fill="none" stroke="#121212" stroke-width="3" transform="rotate(180, {center}, {center})"/>
+            </svg>
+        """,
+        'TAKE_OFF': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <circle cx="{center}" cy="{center}" r="{half}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{c_m8},{c_p4} L{center},{c_m8} L{c_p8},{c_p4}" fill="none" stroke="#121212" stroke-width="3"/>
+            </svg>
+        """,
+        'CRUISE': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <circle cx="{center}" cy="{center}" r="{half}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{c_m8},{center} L{c_p8},{center} M{c_p2},{c_m6} L{c_p8},{center} L{c_p2},{c_p6}" fill="none" stroke="#121212" stroke-width="2"/>
+            </svg>
+        """,
+        'INFANTRY': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <line x1="{padding}" y1="{padding}" x2="{far}" y2="{far}" stroke="#121212" stroke-width="1.5"/>
+                <line x1="{far}" y1="{padding}" x2="{padding}" y2="{far}" stroke="#121212" stroke-width="1.5"/>
+            </svg>
+        """,
+        'ARMOR': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" rx="{half}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <ellipse cx="{center}" cy="{center}" rx="{third}" ry="{sixth}" fill="none" stroke="#121212" stroke-width="2"/>
+            </svg>
+        """,
+        'ARTILLERY': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <circle cx="{center}" cy="{center}" r="4" fill="#121212"/>
+            </svg>
+        """,
+        'AIR': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <path d="M{padding},{center} Q{center},{padding} {far},{center} Q{center},{far} {padding},{center}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{c_m10},{center} L{c_p10},{center}" stroke="#121212" stroke-width="2"/>
+            </svg>
+        """,
+        'MEDEVAC': """
+            <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
+                <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
+                <path d="M{center}, {inner} L{center}, {inner_far} M{inner}, {center} L{inner_far}, {center}" stroke="#ff3860" stroke-width="4"/>
+            </svg>
+        """
+    }
+
     @staticmethod
+    @lru_cache(maxsize=128)
     def get_color(task_code: str) -> str:
         return MilitarySymbolGenerator.COLORS.get(task_code, '#7a7a7a')
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def create_svg(task_code: str, size: int = 40) -> str:
         color = MilitarySymbolGenerator.get_color(task_code)
         padding = 4
         s = size - (padding * 2)
         center = size // 2
 
-        # 기본 프레임 및 내부 심볼 정의
-        symbols = {
-            'RECON': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <line x1="{padding}" y1="{padding}" x2="{size - padding}" y2="{size - padding}" stroke="#121212" stroke-width="2"/>
-                </svg>
-            """,
-            'STRIKE': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <polygon points="{center},{padding} {size - padding},{center} {center},{size - padding} {padding},{center}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center - 5},{center - 5} L{center + 5},{center + 5} M{center + 5},{center - 5} L{center - 5},{center + 5}" stroke="#121212" stroke-width="3"/>
-                </svg>
-            """,
-            'RALLY': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" rx="2" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <circle cx="{center}" cy="{center}" r="4" fill="#121212"/>
-                </svg>
-            """,
-            'LANDING': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <circle cx="{center}" cy="{center}" r="{s // 2}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center - 8},{center + 4} L{center},{center - 8} L{center + 8},{center + 4}" fill="none" stroke="#121212" stroke-width="3" transform="rotate(180, {center}, {center})"/>
-                </svg>
-            """,
-            'TAKE_OFF': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <circle cx="{center}" cy="{center}" r="{s // 2}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center - 8},{center + 4} L{center},{center - 8} L{center + 8},{center + 4}" fill="none" stroke="#121212" stroke-width="3"/>
-                </svg>
-            """,
-            'CRUISE': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <circle cx="{center}" cy="{center}" r="{s // 2}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center - 8},{center} L{center + 8},{center} M{center + 2},{center - 6} L{center + 8},{center} L{center + 2},{center + 6}" fill="none" stroke="#121212" stroke-width="2"/>
-                </svg>
-            """,
-            'INFANTRY': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <line x1="{padding}" y1="{padding}" x2="{size - padding}" y2="{size - padding}" stroke="#121212" stroke-width="1.5"/>
-                    <line x1="{size - padding}" y1="{padding}" x2="{padding}" y2="{size - padding}" stroke="#121212" stroke-width="1.5"/>
-                </svg>
-            """,
-            'ARMOR': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" rx="{s // 2}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <ellipse cx="{center}" cy="{center}" rx="{s // 3}" ry="{s // 6}" fill="none" stroke="#121212" stroke-width="2"/>
-                </svg>
-            """,
-            'ARTILLERY': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <circle cx="{center}" cy="{center}" r="4" fill="#121212"/>
-                </svg>
-            """,
-            'AIR': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <path d="M{padding},{center} Q{center},{padding} {size - padding},{center} Q{center},{size - padding} {padding},{center}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center - 10},{center} L{center + 10},{center}" stroke="#121212" stroke-width="2"/>
-                </svg>
-            """,
-            'MEDEVAC': f"""
-                <svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-                    <rect x="{padding}" y="{padding}" width="{s}" height="{s}" fill="{color}" stroke="#121212" stroke-width="2"/>
-                    <path d="M{center}, {padding + 4} L{center}, {size - padding - 4} M{padding + 4}, {center} L{size - padding - 4}, {center}" stroke="#ff3860" stroke-width="4"/>
-                </svg>
-            """
-        }
+        template = MilitarySymbolGenerator.SVG_TEMPLATES.get(
+            task_code, MilitarySymbolGenerator.SVG_TEMPLATES['RECON'])
+        return template.format(
+            color=color, size=size, padding=padding, s=s, center=center,
+            far=size - padding, inner=padding + 4, inner_far=size - padding - 4,
+            half=s // 2, third=s // 3, sixth=s // 6,
+            c_p2=center + 2, c_p4=center + 4,
+            c_m5=center - 5, c_p5=center + 5, c_m6=center - 6, c_p6=center + 6,
+            c_m8=center - 8, c_p8=center + 8, c_m10=center - 10, c_p10=center + 10,
+        )
 
-        return symbols.get(task_code, symbols['RECON'])
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_icon_url(task_code: str, size: int = 40) -> str:
+        """Leaflet 아이콘용 data URI (base64 인코딩은 작업 코드별로 한 번만 수행)"""
+        svg = MilitarySymbolGenerator.create_svg(task_code, size)
+        svg_b64 = base64.b64encode(svg.encode()).decode()
+        return f"data:image/svg+xml;base64,{svg_b64}"
 
 
 # ============================================================================
 # Leaflet.js 기반 맵 뷰
 # ============================================================================
 
+def _quantize_coordinates(coords, decimals):
+    """GeoJSON coordinates(중첩 리스트)의 모든 좌표값을 decimals 자릿수로 반올림한 새 리스트"""
+    if coords and isinstance(coords[0], (int, float)):
+        return [round(value, decimals) for value in coords]
+    return [_quantize_coordinates(part, decimals) for part in coords]
+
+
+def _quantize_geometry(geometry, decimals=COORD_DECIMALS):
+    """지도 전송 전 geometry 좌표를 COORD_DECIMALS로 반올림 (전송량 감소, 제자리 수정)"""
+    if not geometry or decimals is None:
+        return
+    if 'coordinates' in geometry:
+        geometry['coordinates'] = _quantize_coordinates(geometry['coordinates'], decimals)
+    for part in geometry.get('geometries', ()):
+        _quantize_geometry(part, decimals)
+
+
+def _dumps_compact(obj) -> str:
+    """공백 없는 JSON 문자열 (orjson이 있으면 사용, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _open_geojson(path: Path):
+    """GeoJSON 파일을 바이너리 스트림으로 열기 (.gz로 압축된 파일은 읽으면서 압축 해제)"""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _stream_geojson_features(path: Path):
+    """ijson으로 파일 스트림에서 features를 하나씩 읽기 (파일 전체를 메모리에 올리지 않음)"""
+    with _open_geojson(path) as stream:
+        yield from ijson.items(stream, 'features.item', use_float=True)
+
+
+def _parse_geojson_features(data_future):
+    """미리 읽어 둔 파일 내용 전체를 파싱하여 features를 하나씩 반환 (ijson이 없을 때)"""
+    data = data_future.result()
+    parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+    yield from parsed.get('features', [])
+
+
+def _iter_geojson_files(file_paths, prefetch_depth):
+    """파일마다 feature 이터레이터를 순서대로 반환 (파일은 이터레이터를 처음 순회할 때 읽음)
+
+    ijson이 있으면 각 파일을 스트림으로 열어 피처 단위로 파싱하므로 메모리에는 피처 몇 개만 둔다.
+    ijson이 없으면 어차피 파일 전체를 파싱해야 하므로 작업 스레드에서 최대 prefetch_depth개 앞서 읽어 둔다.
+    """
+    if ijson is not None:
+        for path in file_paths:
+            yield _stream_geojson_features(path)
+        return
+    file_reads = _prefetch_file_bytes(file_paths, prefetch_depth)
+    try:
+        for data_future in file_reads:
+            yield _parse_geojson_features(data_future)
+    finally:
+        file_reads.close()  # 미리 읽기 스레드 정리
+
+
+def _read_geojson_bytes(path: Path) -> bytes:
+    """GeoJSON 파일 내용 전체 읽기 (.gz로 압축된 파일은 압축 해제)"""
+    data = path.read_bytes()
+    if path.suffix == '.gz':
+        return gzip.decompress(data)
+    return data
+
+
+def _prefetch_file_bytes(file_paths, depth):
+    """파일 내용을 작업 스레드에서 최대 depth개 앞서 읽어 두고, 순서대로 Future를 반환
+
+    디스크 읽기와 gzip 압축 해제(GIL 해제)를 호출 측의 파싱/전송과 겹쳐 처리하며, 메모리에는 파싱 중인 파일과 미리 읽은 최대 depth개 파일만 둔다.
+    """
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        paths = iter(file_paths)
+        pending = deque(executor.submit(_read_geojson_bytes, path) for path in islice(paths, depth))
+        for path in paths:
+            yield pending.popleft()
+            pending.append(executor.submit(_read_geojson_bytes, path))
+        while pending:
+            yield pending.popleft()
+
+
+class _GeoJsonLoadSignals(QObject):
+    """_GeoJsonLoadTask가 소유하는 시그널 객체 (작업 스레드 → GUI 스레드)
+
+    view가 먼저 삭제되면 Qt가 연결을 끊으므로, 작업 스레드의 emit은 삭제된 view에 닿지 않는다.
+    """
+    progress = pyqtSignal(int, int, str)  # 현재 파일 번호, 전체 파일 수, 파일명
+    message = pyqtSignal(str, str, 'QVariantList')  # 'begin'/'push'/'end', layer_key, feature 배치
+    layer_done = pyqtSignal(str, int)  # layer_key, feature 수
+    finished = pyqtSignal()
+
+
+class _GeoJsonLoadTask(QRunnable):
+    """GeoJSON 파일 읽기·파싱 작업 (QThreadPool 작업 스레드에서 실행)
+
+    feature 배치와 진행률은 작업이 소유한 signals로 보내며, 큐 연결을 통해 GUI 스레드에서 처리된다.
+    feature 배치는 JS 소스가 아니라 QVariantList로 보내 QWebChannel이 JSON 메시지로 지도에 전달한다.
+    cancel()을 호출하면 다음 feature에서 읽기를 멈추고 종료한다 (창 종료 시 풀 대기를 짧게 유지).
+    """
+
+    def __init__(self, layer_files, chunk_size, prefetch_depth):
+        super().__init__()
+        self.layer_files = layer_files
+        self.chunk_size = chunk_size
+        self.prefetch_depth = prefetch_depth
+        self.signals = _GeoJsonLoadSignals()  # GUI 스레드에서 생성 (연결 대상 view와 같은 스레드)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        signals = self.signals
+        cancelled = self._cancelled
+        chunk_size = self.chunk_size
+        total_files = sum(len(files) for files in self.layer_files.values())
+        loaded_count = 0
+
+        # 파일별 feature 이터레이터 (아래 루프와 같은 레이어 순서로 소비)
+        file_features = _iter_geojson_files(
+            [file_path for file_paths in self.layer_files.values() for file_path in file_paths],
+            self.prefetch_depth,
+        )
+
+        try:
+            for layer_key, file_paths in self.layer_files.items():
+                if not file_paths:
+                    continue
+                if cancelled.is_set():
+                    return
+
+                # 현재 레이어의 모든 파일을 병합하며 배치 단위로 지도에 스트리밍
+                signals.message.emit('begin', layer_key, [])
+                chunk = []
+                feature_count = 0
+                loaded_names = []  # 로드 로그는 레이어마다 한 번에 출력 (파일별 print로 콘솔 잠금을 반복하지 않음)
+
+                for file_path in file_paths:
+                    if cancelled.is_set():
+                        return
+                    loaded_count += 1
+                    signals.progress.emit(loaded_count, total_files, file_path.name)
+
+                    try:
+                        # feature를 하나씩 읽어 배치가 차면 바로 전송 (파일 전체 트리를 메모리에 두지 않음)
+                        for feature in next(file_features):
+                            if cancelled.is_set():
+                                return
+                            _quantize_geometry(feature.get('geometry'))
+                            chunk.append(feature)
+                            if len(chunk) >= chunk_size:
+                                signals.message.emit('push', layer_key, chunk)
+                                feature_count += len(chunk)
+                                chunk = []
+
+                        loaded_names.append(file_path.name)
+                    except Exception as e:
+                        print(f"GeoJSON 로드 오류 ({file_path.name}): {str(e)}")
+
+                if loaded_names:
+                    print(f"GeoJSON 데이터 로드 ({layer_key}, {len(loaded_names)}개 파일): {', '.join(loaded_names)}")
+
+                try:
+                    if chunk:
+                        signals.message.emit('push', layer_key, chunk)
+                        feature_count += len(chunk)
+                    signals.message.emit('end', layer_key, [])
+                    signals.layer_done.emit(layer_key, feature_count)
+                except Exception as e:
+                    print(f"GeoJSON 레이어 추가 오류 ({layer_key}): {str(e)}")
+        finally:
+            file_features.close()  # 미리 읽기 스레드 정리
+            signals.finished.emit()
+
+
+class _MgrsGridTask(QRunnable):
+    """MGRS 그리드 라벨 변환 작업 (QThreadPool 작업 스레드에서 실행)
+
+    결과는 view.mgrs_grid_ready 시그널로 보내며, 큐 연결을 통해 GUI 스레드에서 전달된다.
+    """
+
+    def __init__(self, view, coords, grid_key):
+        super().__init__()
+        self.view = view
+        self.coords = coords
+        self.grid_key = grid_key
+
+    def run(self):
+        try:
+            # 변환 실패("Error: ...")한 셀은 보내지 않아 JS 측에서 위경도 라벨로 대체
+            mgrs_grid_data = {
+                key: mgrs_coord
+                for key, mgrs_coord in zip(
+                    [f"{lat:.3f}_{lon:.3f}" for lat, lon in self.coords],
+                    starmap(MGRSConverter.lat_lon_to_mgrs, self.coords),
+                )
+                if not mgrs_coord.startswith("Error")
+            }
+            self.view.mgrs_grid_ready.emit(self.grid_key, json.dumps(mgrs_grid_data))
+        except Exception as e:
+            print(f"MGRS 그리드 변환 오류: {str(e)}")
+
+
+class _MgrsPointTask(QRunnable):
+    """마우스 위치 MGRS 변환 작업 (MGRS 전용 QThreadPool 작업 스레드에서 실행)
+
+    변환은 MGRSConverter(_MGRS_LOCK)를 거치므로 그리드 작업·GUI 스레드의 변환과 겹치지 않는다.
+    결과는 view.mgrs_point_ready 시그널로 보내며, 큐 연결을 통해 GUI 스레드에서 전달된다.
+    """
+
+    def __init__(self, view, lat, lon, cache_key):
+        super().__init__()
+        self.view = view
+        self.lat = lat
+        self.lon = lon
+        self.cache_key = cache_key
+
+    def run(self):
+        try:
+            mgrs_coord = MGRSConverter.lat_lon_to_mgrs(self.lat, self.lon)
+            self.view.mgrs_point_ready.emit(self.cache_key, mgrs_coord)
+        except Exception as e:
+            print(f"MGRS 변환 오류: {str(e)}")
+
+
 class TacticalMapView(QWebEngineView):
     waypoint_added = pyqtSignal(float, float)
     waypoint_deleted = pyqtSignal(str)  # wp_id
     waypoint_updated = pyqtSignal(str, float, str, float)  # wp_id, alt, task_code, speed
     waypoint_moved = pyqtSignal(str, float, float)  # wp_id, lat, lon
+    map_ready = pyqtSignal()  # JS 지도 초기화 완료 시그널
     geojson_layers_loaded = pyqtSignal()  # GeoJSON 레이어 로드 완료 시그널
+    mgrs_grid_ready = pyqtSignal(str, str)  # grid_key, MGRS 라벨 JSON (작업 스레드 → GUI 스레드)
+    mgrs_point_ready = pyqtSignal(float, str)  # cache_key, 마우스 위치 MGRS (작업 스레드 → GUI 스레드)
+
+    # 마우스 좌표 MGRS는 표시 중인 위경도와 같은 1e-5°(약 1m) 격자로 스냅하여 캐시 (MGRSPrecision=5와 일치)
+    MGRS_GRID_STEPS_PER_DEG = 100000
+    MGRS_HOVER_DEBOUNCE_MS = 40  # 마우스 위치별 MGRS 변환 요청을 모으는 시간
+    GEOJSON_LAYERS = ('apt', 'nav', 'obs', 'raa', 'rca')  # 지원하는 GeoJSON 레이어 타입
+    GEOJSON_CHUNK_SIZE = 500  # pushGeoJsonFeatures 1회당 전달할 GeoJSON feature 수
+    GEOJSON_PREFETCH_FILES = 2  # ijson이 없을 때 작업 스레드에서 미리 읽어 둘 GeoJSON 파일 수
+    WEB_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 지도 타일 디스크 캐시 상한 (512MB)
+
+    _map_html: Optional[str] = None  # generate_map_html 결과 (모든 뷰가 공유)
+
+    # Leaflet 로컬 사본이 있으면 CDN 대신 사용 (leaflet.min.js, leaflet.min.css, images/)
+    LEAFLET_CDN_BASE = "https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.9.4/"
+    LEAFLET_LOCAL_DIR = Path(__file__).parent / "static" / "leaflet"
+
+    # convert_single_mgrs 결과 반영 스크립트 (마우스 이동마다 f-string을 새로 만들지 않도록 미리 정의)
+    MGRS_COORD_JS = (
+        "cachedMgrsCoords.set(%(key)d, %(mgrs)s);"
+        "if (coordsDisplay && displayedMgrsKey === %(key)d) { setCoordField(coordsMgrsSpan, %(mgrs)s); }"
+    )
+
+    # update_mission_info_on_map 스크립트 (고정 스키마이므로 dict 생성/json.dumps 없이 바로 포맷)
+    MISSION_INFO_JS = (
+        'updateMissionInfo({"mission_name":%(name)s,"waypoint_count":%(count)d,'
+        '"total_distance":%(distance).3f,"avg_speed":%(speed).3f,'
+        '"flight_hours":%(hours)d,"flight_minutes":%(minutes)d});'
+    )
+
+    JS_DEBUG_LOG = False  # True면 지도 스크립트의 진행 로그를 콘솔로 출력 (개발용)
 
     _modal = False
     _windowModality = Qt.NonModal
 
     modalChanged = pyqtSignal()
     windowModalityChanged = pyqtSignal()
+    # QWebChannel로 JS에 노출되는 GeoJSON 스트림 (_GeoJsonLoadTask.signals.message를 GUI 스레드에서 그대로 전달)
+    geojsonMessage = pyqtSignal(str, str, 'QVariantList')
 
     @pyqtProperty(bool, notify=modalChanged)
     def modal(self):
@@ -473,12 +923,38 @@ class TacticalMapView(QWebEngineView):
         self.control_zone_visible = False
         self.compass_visible = False
         self.splash = splash  # 스플래시 화면 객체 저장
+        self._thread_pool = QThreadPool.globalInstance()  # GeoJSON 로드 작업용
+        # MGRS 변환 작업 전용 풀 (변환기는 _MGRS_LOCK으로 직렬화되므로 스레드 1개로 충분,
+        # 공용 풀의 스레드를 잠금 대기로 점유하지 않음)
+        self._mgrs_pool = QThreadPool(self)
+        self._mgrs_pool.setMaxThreadCount(1)
+        self._geojson_task = None  # 진행 중인 _GeoJsonLoadTask (취소용)
+        self.available_layers = set()
+        self._pending_mgrs = None  # convert_single_mgrs로 들어온 마지막 (lat, lon, cache_key)
+        self._mgrs_hover_timer = QTimer(self)
+        self._mgrs_hover_timer.setSingleShot(True)
+        self._mgrs_hover_timer.setInterval(self.MGRS_HOVER_DEBOUNCE_MS)
+        self._mgrs_hover_timer.timeout.connect(self._flush_single_mgrs)
+        self.mgrs_grid_ready.connect(self._deliver_mgrs_grid)
+        self.mgrs_point_ready.connect(self._deliver_single_mgrs)
+        self.setup_web_cache()
         self.setup_channel()
         self.load_initial_map()
 
     def contextMenuEvent(self, event):
         pass
 
+    def setup_web_cache(self):
+        """지도 타일을 세션 간 재사용하도록 WebEngine 디스크 HTTP 캐시 설정"""
+        profile = self.page().profile()
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        # 소스 디렉터리가 아닌 사용자 캐시 디렉터리에 저장 (앱 이름 미설정이므로 DART 하위로 고정)
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+        profile.setCachePath(str(Path(cache_root) / "DART" / "webcache"))
+        profile.setHttpCacheMaximumSize(self.WEB_CACHE_MAX_BYTES)
+        # 쿠키를 유지하여 재방문 시 조건부 요청으로 재검증
+        profile.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+
     def setup_channel(self):
         self.channel = QWebChannel()
         self.channel.registerObject("backend", self)
@@ -487,7 +963,17 @@ class TacticalMapView(QWebEngineView):
     def load_initial_map(self):
         """지도를 처음 한 번만 로드합니다."""
         html = self.generate_map_html()
-        self.setHtml(html)
+        if self.has_local_leaflet():
+            # 로컬 Leaflet을 상대 경로로 읽고, 지도 타일은 계속 원격에서 받도록 허용
+            self.settings().setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
+            self.setHtml(html, QUrl.fromLocalFile(str(self.LEAFLET_LOCAL_DIR) + "/"))
+        else:
+            self.setHtml(html)
+
+    @classmethod
+    def has_local_leaflet(cls) -> bool:
+        """static/leaflet 디렉터리에 Leaflet 로컬 사본이 있는지 확인"""
+        return (cls.LEAFLET_LOCAL_DIR / "leaflet.min.js").is_file() and (cls.LEAFLET_LOCAL_DIR / "leaflet.min.css").is_file()
 
     def load_mission(self, mission: Mission):
         """미션을 로드합니다. 지도가 준비되지 않았으면 설정만 하고, 준비되었으면 JS로 업데이트합니다."""
@@ -496,7 +982,16 @@ class TacticalMapView(QWebEngineView):
             self.refresh_map(mission, fit_bounds=True)
 
     def generate_map_html(self) -> str:
+        """Leaflet.js 맵의 기반 HTML 반환 (클래스 상수만 사용하므로 한 번만 생성해 공유)"""
+        cls = type(self)
+        if cls._map_html is None:
+            cls._map_html = cls._build_map_html()
+        return cls._map_html
+
+    @classmethod
+    def _build_map_html(cls) -> str:
         """Leaflet.js 맵의 기반 HTML 생성 (데이터 없이 구조만)"""
+        leaflet_base = "" if cls.has_local_leaflet() else cls.LEAFLET_CDN_BASE
 
         html = f"""
         <!DOCTYPE html>
@@ -504,8 +999,8 @@ class TacticalMapView(QWebEngineView):
         <head>
             <meta charset="utf-8" />
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.9.4/leaflet.min.css" />
-            <script src="https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.9.4/leaflet.min.js"></script>
+            <link rel="stylesheet" href="{leaflet_base}leaflet.min.css" />
+            <script src="{leaflet_base}leaflet.min.js"></script>
             <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
             <style>
                 * {{ margin: 0; padding: 0; }}
@@ -513,36 +1008,23 @@ class TacticalMapView(QWebEngineView):
                 #map {{ width: 100%; height: 100%; cursor: crosshair; }}
                 .leaflet-container {{ background: #121212; }}
                 /* 웨이포인트 레이더 라벨 */
-                .waypoint-label {{
-                    background-color: transparent;
-                    border: none;
-                    box-shadow: none;
-                    color: #00d1b2;
-                    font-weight: bold;
-                    font-size: 11px;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                    font-family: 'Courier New', monospace;
-                    letter-spacing: 0.5px;
-                    text-shadow: 0 0 3px rgba(0, 0, 0, 0.8);
-                }}
                 .leaflet-tooltip {{
                     background-color: transparent;
                     border: none;
                     box-shadow: none;
                 }}
-                /* MGRS 그리드 라벨 */
-                .mgrs-grid-label {{
-                    background-color: rgba(0, 255, 0, 0.2);
-                    border: 1px solid rgba(0, 255, 0, 0.5);
-                    box-shadow: none;
-                    color: #00ff00;
-                    font-weight: bold;
+                /* 관제권 공항 라벨 */
+                .ctl-zone-label {{
+                    background: rgba(255, 255, 255, 0.9);
+                    color: #cc0000;
+                    padding: 3px 6px;
+                    border-radius: 4px;
                     font-size: 10px;
-                    padding: 2px 4px;
-                    border-radius: 2px;
-                    font-family: 'Courier New', monospace;
-                    text-shadow: 0 0 2px rgba(0, 0, 0, 0.8);
+                    font-weight: bold;
+                    white-space: nowrap;
+                    pointer-events: none;
+                    border: 1px solid #ff0000;
+                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
                 }}
                 /* 마우스 좌표 표시 */
                 #mouse-coords {{
@@ -563,6 +1045,8 @@ class TacticalMapView(QWebEngineView):
                     text-shadow: 0 0 2px rgba(0, 0, 0, 0.8);
                     letter-spacing: 0.5px;
                     display: none;
+                    contain: layout paint style;  /* 갱신 시 무효화 범위를 이 요소로 한정 */
+                    will-change: transform;  /* 별도 합성 레이어로 유지 */
                 }}
                 #mouse-coords.visible {{
                     display: block;
@@ -623,7 +1107,7 @@ class TacticalMapView(QWebEngineView):
         </head>
         <body>
             <div id="map"></div>
-            <div id="mouse-coords">LAT: -- LON: -- MGRS: --</div>
+            <div id="mouse-coords">LAT: <span id="coords-lat">--</span> LON: <span id="coords-lon">--</span> MGRS: <span id="coords-mgrs">--</span></div>
             <div id="mission-info">
                 <div class="mission-row"><span class="mission-value" id="mission-name">--</span></div>
                 <div class="mission-row"><span class="mission-value" id="mission-wp">0</span></div>
@@ -634,32 +1118,81 @@ class TacticalMapView(QWebEngineView):
             <script>
                 var backend = null;
                 var map = null;
-                var markers = {{}};
+                var canvasRenderer = null;  // 공유 Canvas 렌더러
+                var markers = new Map();  // wp_id -> 마커
                 var polyline = null;
-                var waypoints = [];
-                var symbols = {{}};
+                var waypoints = decodeWaypoints([]);  // 웨이포인트 SoA (병렬 배열)
+                var symbols = new Map();  // task_code -> 아이콘 data URI
+                var waypointBounds = null;  // addWaypoints에서 누적한 웨이포인트 범위
+                var waypointLabelLayer = null;  // 웨이포인트 라벨 캔버스 레이어
+                var DRAG_MOVE_EPSILON_DEG = 1e-6;  // 이보다 작은 드래그 이동(약 0.1m)은 무시
                 var mgrsGridLayer = null;
-                var mgrsLabels = [];
+                var mgrsGridLines = [];  // mgrsGridLayer에 들어 있는 재사용 격자선 폴리라인
+                var mgrsLabelLayer = null;  // MGRS 그리드 라벨 캔버스 레이어
                 var mgrsGridVisible = false;
+                var MGRS_GRID_REDRAW_DELAY_MS = 150;
+                var mgrsGridRedrawTimer = null;
+                var MGRS_GRID_CACHE_MAX = 64;  // 캐시할 그리드 배치 수 (초과 시 전체 비움)
+                var mgrsGridCache = {{}};  // 그리드 키 -> MGRS 라벨 데이터
+                var mgrsGridCacheSize = 0;
                 var lastMouseCoords = null;
+                var CONTEXT_MENU_DEBOUNCE_MS = 150;
+                var lastContextMenuTime = -Infinity;
+                var pendingMouseLatLng = null;  // 다음 프레임에 표시할 마우스 좌표
+                var coordsFrameRequested = false;
+                var MGRS_GRID_STEPS_PER_DEG = {cls.MGRS_GRID_STEPS_PER_DEG};
+                var cachedMgrsCoords = new Map();  // 정수 격자 키 -> MGRS 문자열
+                var lastMgrsRequestKey = null;
+                var displayedMgrsKey = null;
                 var coordsDisplay = null;
+                var coordsLatSpan = null;  // 좌표 표시의 값 부분 (바뀐 항목만 갱신)
+                var coordsLonSpan = null;
+                var coordsMgrsSpan = null;
+                var shownLatE5 = null;  // 표시 중인 위경도 (1e-5° 단위 정수)
+                var shownLonE5 = null;
                 var coordsDisplayVisible = false;
                 var geoJsonLayers = {{}};
                 var geoJsonVisible = {{}};
                 var controlZoneLayers = {{}};  // 관제권 레이어들을 저장
                 var controlZoneVisible = false;  // 관제권 표시 상태
-                var compassMarkers = {{}};  // 나침반 마커들을 저장
+                var compassLayerGroup = null;  // 나침반이 만든 원/라벨 레이어를 모두 소유하는 그룹 (제거 시 이것만 해제)
+                var compassPool = {{ outer: [], inner: [], labels: null }};  // 다시 그릴 때 재사용하는 나침반 레이어
                 var compassVisible = false;  // 나침반 표시 상태
+                var aptLayerByKey = new Map();  // 'lat,lon'(소수 6자리) -> 공항 포인트 레이어
+                var TASK_CODES = {json.dumps(MilitarySymbolGenerator.TASK_CODES)};  // 작업 코드 인덱스 테이블
+
+                // 진행 로그는 개발 시에만 출력 (QtWebEngine 콘솔 브리지 IPC 절약), 오류는 항상 console.error
+                window.__DART_DEBUG__ = {json.dumps(cls.JS_DEBUG_LOG)};
+                function debugLog() {{
+                    if (window.__DART_DEBUG__) {{
+                        console.log.apply(console, arguments);
+                    }}
+                }}
 
                 // 1. WebChannel 초기화
                 new QWebChannel(qt.webChannelTransport, function(channel) {{
                     backend = channel.objects.backend;
+                    // GeoJSON feature 배치는 JS 소스 대신 채널 메시지(JSON)로 받음
+                    backend.geojsonMessage.connect(onGeoJsonMessage);
                     initMap();
                 }});
 
+                // 빈 레이어 그룹을 레이어 컨트롤에 등록하고, 처음 지도에 추가될 때 실제 타일 레이어 생성
+                function lazyTileLayer(createLayer) {{
+                    var group = L.layerGroup();
+                    group.once('add', function() {{
+                        group.addLayer(createLayer());
+                    }});
+                    return group;
+                }}
+
                 function initMap() {{
                     // 지도 초기화 (기본 좌표: 서울)
+                    // 벡터 레이어는 SVG DOM 대신 단일 Canvas에 렌더링
+                    canvasRenderer = L.canvas({{ padding: 0.5 }});
                     map = L.map('map', {{
+                        preferCanvas: true,
+                        renderer: canvasRenderer,
                         contextmenu: true,
                         contextmenuInheritItems: false,
                         zoomControl: false 
@@ -667,39 +1200,47 @@ class TacticalMapView(QWebEngineView):
 
                     L.control.zoom({{ position: 'bottomright' }}).addTo(map);
 
-                    // 여러 타일 레이어 정의
+                    // 여러 타일 레이어 정의 (기본 다크 모드만 즉시 생성, 나머지는 처음 선택될 때 생성)
                     var darkLayer = L.tileLayer('https://cartodb-basemaps-{{s}}.global.ssl.fastly.net/dark_all/{{z}}/{{x}}/{{y}}.png', {{
                         attribution: '&copy; CartoDB',
                         maxZoom: 19,
                         minZoom: 0
                     }});
 
-                    var lightLayer = L.tileLayer('https://cartodb-basemaps-{{s}}.global.ssl.fastly.net/light_all/{{z}}/{{x}}/{{y}}.png', {{
-                        attribution: '&copy; CartoDB',
-                        maxZoom: 19,
-                        minZoom: 0
+                    var lightLayer = lazyTileLayer(function() {{
+                        return L.tileLayer('https://cartodb-basemaps-{{s}}.global.ssl.fastly.net/light_all/{{z}}/{{x}}/{{y}}.png', {{
+                            attribution: '&copy; CartoDB',
+                            maxZoom: 19,
+                            minZoom: 0
+                        }});
                     }});
 
-                    var osmLayer = L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
-                        attribution: '&copy; OpenStreetMap contributors',
-                        maxZoom: 19,
-                        minZoom: 0
+                    var osmLayer = lazyTileLayer(function() {{
+                        return L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
+                            attribution: '&copy; OpenStreetMap contributors',
+                            maxZoom: 19,
+                            minZoom: 0
+                        }});
                     }});
 
-                    var satelliteLayer = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
-                        attribution: 'Tiles &copy; Esri',
-                        maxZoom: 18,
-                        minZoom: 0
+                    var satelliteLayer = lazyTileLayer(function() {{
+                        return L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
+                            attribution: 'Tiles &copy; Esri',
+                            maxZoom: 18,
+                            minZoom: 0
+                        }});
                     }});
 
-                    var hybridLayer = L.layerGroup([
-                        L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
-                            attribution: 'Tiles &copy; Esri'
-                        }}),
-                        L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/Reference/World_Boundaries_and_Places/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
-                            attribution: 'Tiles &copy; Esri'
-                        }})
-                    ]);
+                    var hybridLayer = lazyTileLayer(function() {{
+                        return L.layerGroup([
+                            L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
+                                attribution: 'Tiles &copy; Esri'
+                            }}),
+                            L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/Reference/World_Boundaries_and_Places/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
+                                attribution: 'Tiles &copy; Esri'
+                            }})
+                        ]);
+                    }});
 
                     // 기본 레이어를 다크 모드로 설정
                     darkLayer.addTo(map);
@@ -717,36 +1258,40 @@ class TacticalMapView(QWebEngineView):
 
                     // 2. 지도 자체 우클릭 이벤트 (웨이포인트 추가)
                     map.on('contextmenu', function(e) {{
-                        if (backend) {{
-                            // Python의 on_map_click(lat, lon) 호출
-                            backend.on_map_click(e.latlng.lat, e.latlng.lng);
-                        }}
+                        if (!backend) return;
+                        // 연속 우클릭은 한 번만 전달 (QWebChannel 메시지 폭주 방지)
+                        var now = performance.now();
+                        if (now - lastContextMenuTime < CONTEXT_MENU_DEBOUNCE_MS) return;
+                        lastContextMenuTime = now;
+
+                        var lat = e.latlng.lat, lng = e.latlng.lng;
+                        if (!isFinite(lat) || !isFinite(lng) || Math.abs(lat) > 90 || Math.abs(lng) > 180) return;
+                        // Python의 on_map_click(lat, lon) 호출
+                        backend.on_map_click(lat, lng);
                     }});
 
                     // 3. 마우스 움직임 이벤트 (좌표 표시)
                     coordsDisplay = document.getElementById('mouse-coords');
+                    coordsLatSpan = document.getElementById('coords-lat');
+                    coordsLonSpan = document.getElementById('coords-lon');
+                    coordsMgrsSpan = document.getElementById('coords-mgrs');
+                    // 마우스 이동은 최신 좌표만 저장하고 화면 갱신은 프레임당 1회로 병합
                     map.on('mousemove', function(e) {{
                         lastMouseCoords = e.latlng;
-                        var lat = e.latlng.lat.toFixed(5);
-                        var lon = e.latlng.lng.toFixed(5);
-
-                        // MGRS 변환 요청 (캐시된 데이터 사용)
-                        var mgrsCoord = '계산 중...';
-                        if (window.cachedMgrsCoords && window.cachedMgrsCoords[lat + '_' + lon]) {{
-                            mgrsCoord = window.cachedMgrsCoords[lat + '_' + lon];
-                        }}
-
-                        coordsDisplay.textContent = `LAT: ${{lat}} LON: ${{lon}} MGRS: ${{mgrsCoord}}`;
-
-                        // Python에 MGRS 변환 요청 (비동기)
-                        if (backend && (!window.cachedMgrsCoords || !window.cachedMgrsCoords[lat + '_' + lon])) {{
-                            backend.convert_single_mgrs(parseFloat(lat), parseFloat(lon), lat + '_' + lon);
+                        pendingMouseLatLng = e.latlng;
+                        if (!coordsFrameRequested) {{
+                            coordsFrameRequested = true;
+                            requestAnimationFrame(flushMouseCoords);
                         }}
                     }});
 
                     map.on('mouseout', function() {{
+                        pendingMouseLatLng = null;
+                        displayedMgrsKey = null;
+                        shownLatE5 = null;
+                        shownLonE5 = null;
                         if (coordsDisplay) {{
-                            coordsDisplay.textContent = 'LAT: -- LON: -- MGRS: --';
+                            setCoordsText('--', '--', '--');
                         }}
                     }});
 
@@ -756,271 +1301,794 @@ class TacticalMapView(QWebEngineView):
                     }}
                 }}
 
-                // GeoJSON 데이터 추가 함수
-                window.addGeoJsonLayer = function(layerName, geoJsonData) {{
-                    if (!geoJsonData) {{
-                        console.error('GeoJSON 데이터가 없음:', layerName);
-                        return;
+                // 팝업 코드값 → 표시 문자열 조회 테이블 (피처마다 다시 만들지 않도록 한 번만 생성)
+                var TRAFFIC_TYPES = {{'0': '군용', '1': '민간'}};
+                var NAV_TYPES = {{'0': 'NDB', '1': 'VOR', '2': 'VORDME', '3': 'DME', '4': 'TACAN'}};
+                var OBS_TYPES = {{'1': '안테나', '2': '건물', '3': '굴뚝', '4': '냉각탑', '5': '기타', '6': '기둥', '7': '풍력 터빈'}};
+                var RAA_ACTIVITIES = {{'0': '공역 이용', '1': '군사 훈련', '2': '위험 구역', '3': '항공기 시험'}};
+                var ICAO_CLASSES = {{'1': 'A', '2': 'B', '3': 'C', '4': 'D', '5': 'E', '6': 'F', '7': 'G'}};
+                var SURFACE_TYPES = {{'0': '아스팔트', '1': '콘크리트', '2': '흙', '12': '자갈', '22': '잔디'}};
+
+                function getSurfaceType(code) {{
+                    return SURFACE_TYPES[code] || '알 수 없음';
+                }}
+
+                // 레이어별 팝업 본문 섹션 (props → html 배열에 추가)
+                var popupSections = {{
+                    apt: function(props, html) {{
+                        // 공항 정보
+                        if (props.icaoCode) html.push('<div><strong>ICAO Code:</strong> ', props.icaoCode, '</div>');
+                        if (props.elevation && props.elevation.value !== undefined) {{
+                            html.push('<div><strong>고도:</strong> ', props.elevation.value, ' ft MSL</div>');
+                        }}
+                        if (props.magneticDeclination) {{
+                            html.push('<div><strong>자기편각:</strong> ', props.magneticDeclination, '°</div>');
+                        }}
+                        if (props.trafficType && props.trafficType.length > 0) {{
+                            var types = props.trafficType.map(t => TRAFFIC_TYPES[t] || t).join(', ');
+                            html.push('<div><strong>교통 형태:</strong> ', types, '</div>');
+                        }}
+                        if (props.private) html.push('<div><strong>사설 공항:</strong> 예</div>');
+                        if (props.ppr) html.push('<div><strong>사전 허가 필요:</strong> 예</div>');
+
+                        // 관제권 드론 비행 제한 정보
+                        html.push('<div style="margin-top: 10px; padding: 8px; background-color: #ffe6e6; border: 1px solid #ff6b6b; border-radius: 4px;"><strong style="color: #cc0000;">드론 비행 제한구역</strong><br><span style="font-size: 11px; color: #666;">관제권 반경 5NM(9.3km) 내 드론 비행 금지</span></div>');
+
+                        // 활주로 정보
+                        if (props.runways && props.runways.length > 0) {{
+                            html.push('<div style="margin-top: 10px;"><strong>활주로:</strong></div>');
+                            for (var i = 0; i < props.runways.length; i++) {{
+                                var rw = props.runways[i];
+                                html.push('<div style="margin-left: 10px; margin-top: 3px;">• ', rw.designator, ': ',
+                                    (rw.dimension ? rw.dimension.length.value + 'm × ' + rw.dimension.width.value + 'm' : ''),
+                                    (rw.surface ? ' (' + (rw.surface.composition && rw.surface.composition[0] ? getSurfaceType(rw.surface.composition[0]) : '알 수 없음') + ')' : ''),
+                                    '</div>');
+                            }}
+                        }}
+                    }},
+                    nav: function(props, html) {{
+                        // 네비게이션 정보
+                        if (props.identifier) html.push('<div><strong>식별자:</strong> ', props.identifier, '</div>');
+                        if (props.frequency) {{
+                            html.push('<div><strong>주파수:</strong> ', props.frequency.value, ' ', (props.frequency.unit === 2 ? 'MHz' : 'kHz'), '</div>');
+                        }}
+                        if (props.channel) html.push('<div><strong>채널:</strong> ', props.channel, '</div>');
+                        if (props.elevation && props.elevation.value !== undefined) {{
+                            html.push('<div><strong>고도:</strong> ', props.elevation.value, ' ft MSL</div>');
+                        }}
+                        if (props.magneticDeclination) {{
+                            html.push('<div><strong>자기편각:</strong> ', props.magneticDeclination, '°</div>');
+                        }}
+                        if (props.type !== undefined) {{
+                            html.push('<div><strong>타입:</strong> ', (NAV_TYPES[props.type] || props.type), '</div>');
+                        }}
+                    }},
+                    obs: function(props, html) {{
+                        // 장애물 정보
+                        if (props.elevation && props.elevation.value !== undefined) {{
+                            html.push('<div><strong>고도:</strong> ', props.elevation.value, ' ft MSL</div>');
+                        }}
+                        if (props.elevationGeoid && props.elevationGeoid.hae !== undefined) {{
+                            html.push('<div><strong>해발 고도:</strong> ', Math.round(props.elevationGeoid.hae), ' ft</div>');
+                        }}
+                        if (props.type !== undefined) {{
+                            html.push('<div><strong>타입:</strong> ', (OBS_TYPES[props.type] || '기타'), '</div>');
+                        }}
+                        if (props.osmTags && props.osmTags.power) {{
+                            html.push('<div><strong>전력 관련:</strong> ', props.osmTags.power, '</div>');
+                        }}
+                    }},
+                    raa: function(props, html) {{
+                        // 제한구역 정보
+                        if (props.activity !== undefined) {{
+                            html.push('<div><strong>활동:</strong> ', (RAA_ACTIVITIES[props.activity] || props.activity), '</div>');
+                        }}
+                        if (props.icaoClass !== undefined) {{
+                            html.push('<div><strong>ICAO 등급:</strong> ', (ICAO_CLASSES[props.icaoClass] || props.icaoClass), '</div>');
+                        }}
+                        if (props.upperLimit && props.upperLimit.value !== undefined) {{
+                            html.push('<div><strong>상한:</strong> ', props.upperLimit.value, ' ft</div>');
+                        }}
+                        if (props.lowerLimit && props.lowerLimit.value !== undefined) {{
+                            html.push('<div><strong>하한:</strong> ', props.lowerLimit.value, ' ft</div>');
+                        }}
+                        if (props.onRequest) html.push('<div><strong>요청 시 운용:</strong> 예</div>');
+                        if (props.byNotam) html.push('<div><strong>NOTAM 발행:</strong> 예</div>');
+                        if (props.remarks) html.push('<div><strong>비고:</strong> ', props.remarks, '</div>');
+                    }},
+                    rca: function(props, html) {{
+                        // R-Class 구역 정보
+                        if (props.elevation && props.elevation.value !== undefined) {{
+                            html.push('<div><strong>지상 고도:</strong> ', props.elevation.value, ' ft MSL</div>');
+                        }}
+                        if (props.permittedAltitude && props.permittedAltitude.value !== undefined) {{
+                            html.push('<div><strong>허용 고도:</strong> ', props.permittedAltitude.value, ' ft</div>');
+                        }}
+                        if (props.turbine) html.push('<div><strong>터빈:</strong> 예</div>');
+                        if (props.combustion) html.push('<div><strong>연소:</strong> 예</div>');
+                        if (props.electric) html.push('<div><strong>전기:</strong> 예</div>');
+                        if (props.osmTags && props.osmTags.sport) {{
+                            html.push('<div><strong>스포츠:</strong> ', props.osmTags.sport, '</div>');
+                        }}
                     }}
-                    
-                    console.log('GeoJSON 레이어 로드 시작:', layerName, 'features:', geoJsonData.features ? geoJsonData.features.length : 0);
-                    
-                    var styleColors = {{
-                        'apt': '#ff6b6b',    // 빨강 - Airport
-                        'nav': '#4ecdc4',    // 청록 - Navigation
-                        'obs': '#ffe66d',    // 노랑 - Obstacle
-                        'raa': '#ff69b4',    // 핫핑크 - Restricted Area (더 눈에 띄는 색상)
-                        'rca': '#ffd3b6'     // 주황 - R-Class Area
+                }};
+
+                // 팝업 HTML 공통 조각 (피처마다 같은 스타일 문자열을 다시 만들지 않도록 상수로 보관)
+                var POPUP_OPEN = '<div style="max-height: 400px; overflow-y: auto; font-family: Arial, sans-serif; font-size: 12px;">';
+                var POPUP_TITLE_OPEN = '<h3 style="margin: 0 0 10px 0; color: #2c3e50; border-bottom: 2px solid ';
+                var POPUP_TITLE_MID = '; padding-bottom: 5px;">';
+                var POPUP_COUNTRY_OPEN = '<div style="margin-top: 8px;"><strong>국가:</strong> ';
+                var POPUP_COORDS_OPEN = '<div style="margin-top: 8px; font-size: 11px; color: #666;"><strong>좌표:</strong> ';
+
+                // 헤더/공통 정보는 공유하고 레이어별 섹션만 고정한 팝업 HTML 생성 함수를 만듦
+                function makePopupBuilder(section) {{
+                    return function(feature, color) {{
+                        var html = [POPUP_OPEN];
+                        var props = feature.properties;
+
+                        if (props) {{
+                            // 헤더 섹션 - 이름과 타입
+                            if (props.name) {{
+                                html.push(POPUP_TITLE_OPEN, color, POPUP_TITLE_MID, props.name, '</h3>');
+                            }}
+
+                            section(props, html);
+
+                            // 공통 정보
+                            if (props.country) html.push(POPUP_COUNTRY_OPEN, props.country, '</div>');
+
+                            // 좌표 정보 (geometry에서)
+                            var geometry = feature.geometry;
+                            if (geometry && geometry.coordinates && geometry.type === 'Point') {{
+                                var coords = geometry.coordinates;
+                                html.push(POPUP_COORDS_OPEN, coords[1].toFixed(6), '°N, ', coords[0].toFixed(6), '°E</div>');
+                            }}
+                        }}
+
+                        html.push('</div>');
+                        return html.join('');
                     }};
-                    
-                    var color = styleColors[layerName] || '#888888';
-                    
-                    try {{
-                        // 공항인 경우 관제권 레이어 미리 생성
-                        if (layerName === 'apt') {{
-                            var controlZoneGroup = L.layerGroup();
-                            
-                            // 공항 관제권 생성을 위한 임시 처리
-                            geoJsonData.features.forEach(function(feature) {{
-                                if (feature.geometry && feature.geometry.type === 'Point') {{
-                                    var latlng = L.latLng(feature.geometry.coordinates[1], feature.geometry.coordinates[0]);
-                                    
-                                    // 5NM = 9.26km (정확한 값)
-                                    var controlZoneRadius = 9260; // 미터 단위
-                                    
-                                    // 관제권 원형 오버레이 생성
-                                    var controlZoneCircle = L.circle(latlng, {{
-                                        radius: controlZoneRadius,
-                                        color: '#ff0000',
-                                        weight: 2,
-                                        opacity: 0.6,
-                                        fill: true,
-                                        fillColor: '#ff0000',
-                                        fillOpacity: 0.1,
-                                        dashArray: '10, 5'
-                                    }});
-                                    
-                                    // 공항 정보 라벨 생성
-                                    var airportName = feature.properties.name || '공항';
-                                    var icaoCode = feature.properties.icaoCode || '';
-                                    var labelText = airportName + (icaoCode ? ' (' + icaoCode + ')' : '');
-                                    
-                                    var controlZoneLabel = L.marker(latlng, {{
-                                        icon: L.divIcon({{
-                                            className: 'control-zone-label',
-                                            html: '<div style="background: rgba(255,255,255,0.9); color: #cc0000; padding: 3px 6px; border-radius: 4px; font-size: 10px; font-weight: bold; white-space: nowrap; pointer-events: none; border: 1px solid #ff0000; box-shadow: 0 2px 4px rgba(0,0,0,0.3);">' + labelText + '</div>',
-                                            iconSize: null,
-                                            iconAnchor: [0, -20]
-                                        }})
-                                    }});
-                                    
-                                    // 관제권 원형과 라벨에 클릭 이벤트 추가 - 공항 정보 표시
-                                    controlZoneCircle.on('click', function() {{
-                                        // GeoJSON 레이어의 apt 마커에서 해당 공항의 팝업을 표시
-                                        if (geoJsonLayers['apt']) {{
-                                            geoJsonLayers['apt'].eachLayer(function(layer) {{
-                                                if (layer.getLatLng && layer.getLatLng().equals(latlng)) {{
-                                                    layer.openPopup();
-                                                }}
-                                            }});
-                                        }}
-                                    }});
-                                    
-                                    controlZoneLabel.on('click', function() {{
-                                        // GeoJSON 레이어의 apt 마커에서 해당 공항의 팝업을 표시
-                                        if (geoJsonLayers['apt']) {{
-                                            geoJsonLayers['apt'].eachLayer(function(layer) {{
-                                                if (layer.getLatLng && layer.getLatLng().equals(latlng)) {{
-                                                    layer.openPopup();
-                                                }}
-                                            }});
-                                        }}
-                                    }});
-                                    
-                                    // 관제권 그룹에 추가
-                                    controlZoneGroup.addLayer(controlZoneCircle);
-                                    controlZoneGroup.addLayer(controlZoneLabel);
-                                }}
-                            }});
-                            
-                            // 관제권 레이어 저장
-                            controlZoneLayers[layerName] = controlZoneGroup;
+                }}
+
+                var popupBuilders = {{}};
+                for (var sectionName in popupSections) {{
+                    popupBuilders[sectionName] = makePopupBuilder(popupSections[sectionName]);
+                }}
+                var defaultPopupBuilder = makePopupBuilder(function() {{}});
+
+                // 팝업 HTML은 처음 열 때 한 번만 만들어 바인딩 (대부분의 피처는 클릭되지 않음)
+                // popupSpec {{ build, color }}은 GeoJSON 레이어마다 하나를 모든 피처가 공유 (피처별 클로저 없음)
+                function bindLazyPopup(layer, popupSpec) {{
+                    layer.popupSpec = popupSpec;
+                    layer.on('click', openLazyPopup);
+                }}
+
+                function ensureLazyPopup(layer) {{
+                    if (!layer.getPopup()) {{
+                        layer.bindPopup(layer.popupSpec.build(layer.feature, layer.popupSpec.color));
+                    }}
+                    return layer;
+                }}
+
+                // 첫 클릭에서만 팝업을 만들어 열고, 이후 클릭은 bindPopup이 등록한 기본 핸들러가 처리
+                function openLazyPopup(e) {{
+                    var layer = e.target;
+                    if (layer.getPopup()) return;
+                    ensureLazyPopup(layer).openPopup(e.latlng);
+                }}
+
+                // 5NM = 9.26km (정확한 값), 미터 단위
+                var CONTROL_ZONE_RADIUS_M = 9260;
+                var ZONE_INDEX_CELL_DEG = 0.2;  // 관제권 공간 인덱스 셀 크기 (반경보다 큼)
+
+                // GeoJSON apt 레이어에서 해당 위치 공항의 팝업을 표시
+                function airportKey(lat, lon) {{
+                    return lat.toFixed(6) + ',' + lon.toFixed(6);
+                }}
+
+                function openAirportPopup(lat, lon) {{
+                    var layer = aptLayerByKey.get(airportKey(lat, lon));
+                    if (layer) {{
+                        ensureLazyPopup(layer).openPopup();
+                    }}
+                }}
+
+                // 관제권 원형 전체를 하나의 <canvas>에 그리는 오버레이 (공항 수와 무관하게 DOM 1개)
+                var ControlZoneCanvasLayer = L.Layer.extend({{
+                    initialize: function(zones) {{
+                        this._zones = zones;  // SoA: {{ lats, lons, radiiMeters, labels }}
+                        this._maxRadiusMeters = 0;
+                        for (var i = 0; i < zones.radiiMeters.length; i++) {{
+                            if (zones.radiiMeters[i] > this._maxRadiusMeters) this._maxRadiusMeters = zones.radiiMeters[i];
                         }}
-                        
-                        var geoJsonLayer = L.geoJSON(geoJsonData, {{
-                            style: function(feature) {{
-                                // Polygon/Polyline 스타일
-                                return {{
-                                    color: color,
-                                    weight: 3,
-                                    opacity: 1.0,
-                                    fill: true,
-                                    fillColor: color,
-                                    fillOpacity: 0.4
-                                }};
-                            }},
-                            pointToLayer: function(feature, latlng) {{                                
-                                // 더 큰 마커로 표시
-                                return L.marker(latlng, {{
-                                    icon: L.divIcon({{
-                                        className: 'geojson-marker',
-                                        html: '<div style="background-color: ' + color + '; width: 12px; height: 12px; border-radius: 50%; border: 2px solid #000; cursor: pointer;"></div>',
-                                        iconSize: [16, 16],
-                                        iconAnchor: [8, 8]
-                                    }})
-                                }});
-                            }},
-                        onEachFeature: function(feature, layer) {{
-                            var popupContent = '<div style="max-height: 400px; overflow-y: auto; font-family: Arial, sans-serif; font-size: 12px;">';
-                            var props = feature.properties;
-                            
-                            if (props) {{
-                                // 헤더 섹션 - 이름과 타입
-                                if (props.name) {{
-                                    popupContent += '<h3 style="margin: 0 0 10px 0; color: #2c3e50; border-bottom: 2px solid ' + color + '; padding-bottom: 5px;">' + props.name + '</h3>';
-                                }}
-                                
-                                // 레이어별 맞춤 정보 표시
-                                if (layerName === 'apt') {{
-                                    // 공항 정보
-                                    if (props.icaoCode) popupContent += '<div><strong>ICAO Code:</strong> ' + props.icaoCode + '</div>';
-                                    if (props.elevation && props.elevation.value !== undefined) {{
-                                        popupContent += '<div><strong>고도:</strong> ' + props.elevation.value + ' ft MSL</div>';
-                                    }}
-                                    if (props.magneticDeclination) {{
-                                        popupContent += '<div><strong>자기편각:</strong> ' + props.magneticDeclination + '°</div>';
-                                    }}
-                                    if (props.trafficType && props.trafficType.length > 0) {{
-                                        var trafficTypes = {{'0': '군용', '1': '민간'}};
-                                        var types = props.trafficType.map(t => trafficTypes[t] || t).join(', ');
-                                        popupContent += '<div><strong>교통 형태:</strong> ' + types + '</div>';
-                                    }}
-                                    if (props.private) popupContent += '<div><strong>사설 공항:</strong> 예</div>';
-                                    if (props.ppr) popupContent += '<div><strong>사전 허가 필요:</strong> 예</div>';
-                                    
-                                    // 관제권 드론 비행 제한 정보
-                                    popupContent += '<div style="margin-top: 10px; padding: 8px; background-color: #ffe6e6; border: 1px solid #ff6b6b; border-radius: 4px;"><strong style="color: #cc0000;">드론 비행 제한구역</strong><br><span style="font-size: 11px; color: #666;">관제권 반경 5NM(9.3km) 내 드론 비행 금지</span></div>';
-                                    
-                                    // 활주로 정보
-                                    if (props.runways && props.runways.length > 0) {{
-                                        popupContent += '<div style="margin-top: 10px;"><strong>활주로:</strong></div>';
-                                        props.runways.forEach(function(rw) {{
-                                            popupContent += '<div style="margin-left: 10px; margin-top: 3px;">• ' + rw.designator + ': ' + 
-                                                (rw.dimension ? rw.dimension.length.value + 'm × ' + rw.dimension.width.value + 'm' : '') + 
-                                                (rw.surface ? ' (' + (rw.surface.composition && rw.surface.composition[0] ? getSurfaceType(rw.surface.composition[0]) : '알 수 없음') + ')' : '') + '</div>';
-                                        }});
-                                    }}
-                                }} else if (layerName === 'nav') {{
-                                    // 네비게이션 정보
-                                    if (props.identifier) popupContent += '<div><strong>식별자:</strong> ' + props.identifier + '</div>';
-                                    if (props.frequency) {{
-                                        popupContent += '<div><strong>주파수:</strong> ' + props.frequency.value + ' ' + (props.frequency.unit === 2 ? 'MHz' : 'kHz') + '</div>';
-                                    }}
-                                    if (props.channel) popupContent += '<div><strong>채널:</strong> ' + props.channel + '</div>';
-                                    if (props.elevation && props.elevation.value !== undefined) {{
-                                        popupContent += '<div><strong>고도:</strong> ' + props.elevation.value + ' ft MSL</div>';
-                                    }}
-                                    if (props.magneticDeclination) {{
-                                        popupContent += '<div><strong>자기편각:</strong> ' + props.magneticDeclination + '°</div>';
-                                    }}
-                                    var navTypes = {{'0': 'NDB', '1': 'VOR', '2': 'VORDME', '3': 'DME', '4': 'TACAN'}};
-                                    if (props.type !== undefined) {{
-                                        popupContent += '<div><strong>타입:</strong> ' + (navTypes[props.type] || props.type) + '</div>';
-                                    }}
-                                }} else if (layerName === 'obs') {{
-                                    // 장애물 정보
-                                    if (props.elevation && props.elevation.value !== undefined) {{
-                                        popupContent += '<div><strong>고도:</strong> ' + props.elevation.value + ' ft MSL</div>';
-                                    }}
-                                    if (props.elevationGeoid && props.elevationGeoid.hae !== undefined) {{
-                                        popupContent += '<div><strong>해발 고도:</strong> ' + Math.round(props.elevationGeoid.hae) + ' ft</div>';
-                                    }}
-                                    var obsTypes = {{'1': '안테나', '2': '건물', '3': '굴뚝', '4': '냉각탑', '5': '기타', '6': '기둥', '7': '풍력 터빈'}};
-                                    if (props.type !== undefined) {{
-                                        popupContent += '<div><strong>타입:</strong> ' + (obsTypes[props.type] || '기타') + '</div>';
-                                    }}
-                                    if (props.osmTags && props.osmTags.power) {{
-                                        popupContent += '<div><strong>전력 관련:</strong> ' + props.osmTags.power + '</div>';
-                                    }}
-                                }} else if (layerName === 'raa') {{
-                                    // 제한구역 정보
-                                    if (props.activity !== undefined) {{
-                                        var activities = {{'0': '공역 이용', '1': '군사 훈련', '2': '위험 구역', '3': '항공기 시험'}};
-                                        popupContent += '<div><strong>활동:</strong> ' + (activities[props.activity] || props.activity) + '</div>';
-                                    }}
-                                    if (props.icaoClass !== undefined) {{
-                                        var classes = {{'1': 'A', '2': 'B', '3': 'C', '4': 'D', '5': 'E', '6': 'F', '7': 'G'}};
-                                        popupContent += '<div><strong>ICAO 등급:</strong> ' + (classes[props.icaoClass] || props.icaoClass) + '</div>';
-                                    }}
-                                    if (props.upperLimit && props.upperLimit.value !== undefined) {{
-                                        popupContent += '<div><strong>상한:</strong> ' + props.upperLimit.value + ' ft</div>';
-                                    }}
-                                    if (props.lowerLimit && props.lowerLimit.value !== undefined) {{
-                                        popupContent += '<div><strong>하한:</strong> ' + props.lowerLimit.value + ' ft</div>';
-                                    }}
-                                    if (props.onRequest) popupContent += '<div><strong>요청 시 운용:</strong> 예</div>';
-                                    if (props.byNotam) popupContent += '<div><strong>NOTAM 발행:</strong> 예</div>';
-                                    if (props.remarks) popupContent += '<div><strong>비고:</strong> ' + props.remarks + '</div>';
-                                }} else if (layerName === 'rca') {{
-                                    // R-Class 구역 정보
-                                    if (props.elevation && props.elevation.value !== undefined) {{
-                                        popupContent += '<div><strong>지상 고도:</strong> ' + props.elevation.value + ' ft MSL</div>';
-                                    }}
-                                    if (props.permittedAltitude && props.permittedAltitude.value !== undefined) {{
-                                        popupContent += '<div><strong>허용 고도:</strong> ' + props.permittedAltitude.value + ' ft</div>';
-                                    }}
-                                    if (props.turbine) popupContent += '<div><strong>터빈:</strong> 예</div>';
-                                    if (props.combustion) popupContent += '<div><strong>연소:</strong> 예</div>';
-                                    if (props.electric) popupContent += '<div><strong>전기:</strong> 예</div>';
-                                    if (props.osmTags && props.osmTags.sport) {{
-                                        popupContent += '<div><strong>스포츠:</strong> ' + props.osmTags.sport + '</div>';
-                                    }}
-                                }}
-                                
-                                // 공통 정보
-                                if (props.country) popupContent += '<div style="margin-top: 8px;"><strong>국가:</strong> ' + props.country + '</div>';
-                                
-                                // 좌표 정보 (geometry에서)
-                                if (feature.geometry && feature.geometry.coordinates) {{
-                                    var coords = feature.geometry.coordinates;
-                                    if (feature.geometry.type === 'Point') {{
-                                        popupContent += '<div style="margin-top: 8px; font-size: 11px; color: #666;"><strong>좌표:</strong> ' + 
-                                            coords[1].toFixed(6) + '°N, ' + coords[0].toFixed(6) + '°E</div>';
+                        this._buildIndex();
+                    }},
+
+                    // 위경도 격자 버킷 인덱스 (클릭 hit-test용)
+                    _buildIndex: function() {{
+                        this._index = new Map();
+                        var lats = this._zones.lats, lons = this._zones.lons;
+                        for (var i = 0; i < lats.length; i++) {{
+                            var key = Math.floor(lats[i] / ZONE_INDEX_CELL_DEG) + ':' + Math.floor(lons[i] / ZONE_INDEX_CELL_DEG);
+                            var bucket = this._index.get(key);
+                            if (bucket) {{
+                                bucket.push(i);
+                            }} else {{
+                                this._index.set(key, [i]);
+                            }}
+                        }}
+                    }},
+
+                    onAdd: function(map) {{
+                        this._canvas = L.DomUtil.create('canvas', 'control-zone-canvas leaflet-zoom-hide');
+                        this._canvas.style.pointerEvents = 'none';
+                        map.getPane('overlayPane').appendChild(this._canvas);
+                        map.on('moveend zoomend viewreset resize', this._redraw, this);
+                        map.on('click', this._onClick, this);
+                        this._redraw();
+                    }},
+
+                    onRemove: function(map) {{
+                        map.off('moveend zoomend viewreset resize', this._redraw, this);
+                        map.off('click', this._onClick, this);
+                        L.DomUtil.remove(this._canvas);
+                        this._canvas = null;
+                    }},
+
+                    _redraw: function() {{
+                        var map = this._map;
+                        if (!map || !this._canvas) return;
+                        var size = map.getSize();
+                        var canvas = this._canvas;
+                        L.DomUtil.setPosition(canvas, map.containerPointToLayerPoint([0, 0]));
+                        canvas.width = size.x;
+                        canvas.height = size.y;
+
+                        var ctx = canvas.getContext('2d');
+                        ctx.lineWidth = 2;
+                        ctx.setLineDash([10, 5]);
+                        ctx.strokeStyle = 'rgba(255, 0, 0, 0.6)';
+                        ctx.fillStyle = 'rgba(255, 0, 0, 0.1)';
+
+                        // 줌 레벨의 미터/픽셀 비율 (위도 보정은 원마다 적용)
+                        var metersPerPixelEquator = 40075016.686 / (256 * Math.pow(2, map.getZoom()));
+                        // 화면 범위를 최대 반경만큼 넓힌 위경도 상자로 먼저 걸러 화면 밖 원은 투영하지 않음
+                        var bounds = map.getBounds();
+                        var south = bounds.getSouth(), north = bounds.getNorth();
+                        var marginLat = this._maxRadiusMeters / 111000;
+                        var maxAbsLat = Math.min(89, Math.max(Math.abs(south), Math.abs(north)) + marginLat);
+                        var marginLon = marginLat / Math.cos(maxAbsLat * Math.PI / 180);
+                        var minLat = south - marginLat, maxLat = north + marginLat;
+                        var minLon = bounds.getWest() - marginLon, maxLon = bounds.getEast() + marginLon;
+
+                        // 보이는 원 전체를 하나의 경로로 모아 fill/stroke 1회씩만 수행
+                        var zones = this._zones;
+                        ctx.beginPath();
+                        for (var i = 0; i < zones.lats.length; i++) {{
+                            var lat = zones.lats[i], lon = zones.lons[i];
+                            if (lat < minLat || lat > maxLat || lon < minLon || lon > maxLon) continue;
+                            var p = map.latLngToContainerPoint([zones.lats[i], zones.lons[i]]);
+                            var r = zones.radiiMeters[i] / (metersPerPixelEquator * Math.cos(zones.lats[i] * Math.PI / 180));
+                            if (p.x + r < 0 || p.y + r < 0 || p.x - r > size.x || p.y - r > size.y) continue;
+                            ctx.moveTo(p.x + r, p.y);
+                            ctx.arc(p.x, p.y, r, 0, 2 * Math.PI);
+                        }}
+                        ctx.fill();
+                        ctx.stroke();
+                    }},
+
+                    // 클릭 위치를 포함하는 관제권을 공간 인덱스로 찾아 공항 팝업 표시
+                    _onClick: function(e) {{
+                        if (e.sourceTarget && e.sourceTarget !== this._map) return;  // 다른 레이어 클릭은 무시
+                        var lat = e.latlng.lat, lon = e.latlng.lng;
+                        var cellLat = Math.floor(lat / ZONE_INDEX_CELL_DEG);
+                        var cellLon = Math.floor(lon / ZONE_INDEX_CELL_DEG);
+                        var zones = this._zones;
+                        for (var dLat = -1; dLat <= 1; dLat++) {{
+                            for (var dLon = -1; dLon <= 1; dLon++) {{
+                                var bucket = this._index.get((cellLat + dLat) + ':' + (cellLon + dLon));
+                                if (!bucket) continue;
+                                for (var k = 0; k < bucket.length; k++) {{
+                                    var i = bucket[k];
+                                    if (this._map.distance([zones.lats[i], zones.lons[i]], e.latlng) <= zones.radiiMeters[i]) {{
+                                        openAirportPopup(zones.lats[i], zones.lons[i]);
+                                        return;
                                     }}
                                 }}
                             }}
-                            
-                            popupContent += '</div>';
-                            
-                            // Surface type helper function
-                            function getSurfaceType(code) {{
-                                var surfaces = {{
-                                    '0': '아스팔트',
-                                    '1': '콘크리트', 
-                                    '2': '흙',
-                                    '12': '자갈',
-                                    '22': '잔디'
-                                }};
-                                return surfaces[code] || '알 수 없음';
+                        }}
+                    }}
+                }});
+
+                // MGRS 그리드 라벨 전체를 하나의 <canvas>에 그리는 오버레이 (라벨 DOM 노드 없음)
+                var MgrsLabelCanvasLayer = L.Layer.extend({{
+                    initialize: function(labels) {{
+                        this._labels = labels;  // SoA: {{ lats, lons, texts }}
+                    }},
+
+                    setLabels: function(labels) {{
+                        this._labels = labels;
+                        this._redraw();
+                    }},
+
+                    onAdd: function(map) {{
+                        this._canvas = L.DomUtil.create('canvas', 'mgrs-label-canvas leaflet-zoom-hide');
+                        this._canvas.style.pointerEvents = 'none';
+                        map.getPane('overlayPane').appendChild(this._canvas);
+                        map.on('moveend zoomend viewreset resize', this._redraw, this);
+                        this._redraw();
+                    }},
+
+                    onRemove: function(map) {{
+                        map.off('moveend zoomend viewreset resize', this._redraw, this);
+                        L.DomUtil.remove(this._canvas);
+                        this._canvas = null;
+                    }},
+
+                    _redraw: function() {{
+                        var map = this._map;
+                        if (!map || !this._canvas) return;
+                        var size = map.getSize();
+                        var canvas = this._canvas;
+                        L.DomUtil.setPosition(canvas, map.containerPointToLayerPoint([0, 0]));
+                        canvas.width = size.x;
+                        canvas.height = size.y;
+
+                        var ctx = canvas.getContext('2d');
+                        ctx.font = "bold 10px 'Courier New', monospace";
+                        ctx.textBaseline = 'top';
+                        ctx.lineWidth = 1;
+                        ctx.strokeStyle = 'rgba(0, 255, 0, 0.5)';
+                        ctx.shadowColor = 'rgba(0, 0, 0, 0.8)';
+
+                        // 라벨 좌상단이 격자 중심에 오도록 배치 (패딩 2px/4px)
+                        var labels = this._labels;
+                        for (var i = 0; i < labels.lats.length; i++) {{
+                            var text = labels.texts[i];
+                            if (!text) continue;
+                            var p = map.latLngToContainerPoint([labels.lats[i], labels.lons[i]]);
+                            var w = ctx.measureText(text).width + 8;
+                            var h = 16;
+                            if (p.x > size.x || p.y > size.y || p.x + w < 0 || p.y + h < 0) continue;
+
+                            ctx.shadowBlur = 0;
+                            ctx.fillStyle = 'rgba(0, 255, 0, 0.2)';
+                            ctx.fillRect(p.x, p.y, w, h);
+                            ctx.strokeRect(p.x + 0.5, p.y + 0.5, w - 1, h - 1);
+
+                            ctx.shadowBlur = 2;
+                            ctx.fillStyle = '#00ff00';
+                            ctx.fillText(text, p.x + 4, p.y + 3);
+                        }}
+                    }}
+                }});
+
+                // 웨이포인트 라벨 전체를 하나의 <canvas>에 그리는 오버레이 (마커별 툴팁 DOM 없음)
+                // 위치는 전역 waypoints SoA에서 직접 읽으므로 드래그 중에는 redraw()만 호출
+                var WaypointLabelCanvasLayer = L.Layer.extend({{
+                    initialize: function() {{
+                        this._texts = [];  // waypoints 인덱스와 같은 순서의 라벨 문자열
+                        this._frame = null;
+                    }},
+
+                    setTexts: function(texts) {{
+                        this._texts = texts;
+                        this._redraw();
+                    }},
+
+                    // 다음 프레임에 한 번만 다시 그리기 (드래그 중 연속 호출 합치기)
+                    redraw: function() {{
+                        if (this._frame !== null) return;
+                        var self = this;
+                        this._frame = requestAnimationFrame(function() {{
+                            self._frame = null;
+                            self._redraw();
+                        }});
+                    }},
+
+                    onAdd: function(map) {{
+                        this._canvas = L.DomUtil.create('canvas', 'waypoint-label-canvas leaflet-zoom-hide');
+                        this._canvas.style.pointerEvents = 'none';
+                        map.getPane('overlayPane').appendChild(this._canvas);
+                        map.on('moveend zoomend viewreset resize', this._redraw, this);
+                        this._redraw();
+                    }},
+
+                    onRemove: function(map) {{
+                        map.off('moveend zoomend viewreset resize', this._redraw, this);
+                        if (this._frame !== null) {{
+                            cancelAnimationFrame(this._frame);
+                            this._frame = null;
+                        }}
+                        L.DomUtil.remove(this._canvas);
+                        this._canvas = null;
+                    }},
+
+                    _redraw: function() {{
+                        var map = this._map;
+                        if (!map || !this._canvas) return;
+                        var size = map.getSize();
+                        var canvas = this._canvas;
+                        L.DomUtil.setPosition(canvas, map.containerPointToLayerPoint([0, 0]));
+                        canvas.width = size.x;
+                        canvas.height = size.y;
+
+                        var ctx = canvas.getContext('2d');
+                        ctx.font = "bold 11px 'Courier New', monospace";
+                        ctx.textBaseline = 'middle';
+                        ctx.fillStyle = '#00d1b2';
+                        ctx.shadowColor = 'rgba(0, 0, 0, 0.8)';
+                        ctx.shadowBlur = 3;
+
+                        // 마커 오른쪽 24px(오프셋 20px + 패딩 4px)에 세로 중앙 정렬
+                        var texts = this._texts;
+                        var n = Math.min(texts.length, waypoints.len);
+                        for (var i = 0; i < n; i++) {{
+                            var p = map.latLngToContainerPoint([waypoints.lats[i], waypoints.lons[i]]);
+                            var x = p.x + 24;
+                            if (x > size.x || p.y < -8 || p.y > size.y + 8) continue;
+                            ctx.fillText(texts[i], x, p.y);
+                        }}
+                    }}
+                }});
+
+                // 나침반 방향/각도 라벨 전체를 하나의 <canvas>에 그리는 오버레이 (라벨 DOM 노드·리스너 없음)
+                var CompassLabelCanvasLayer = L.Layer.extend({{
+                    initialize: function(labels) {{
+                        this._labels = labels;  // SoA: {{ lats, lons, texts, isDegree }}
+                        this._hovered = -1;  // 마우스가 올라간 각도 라벨 인덱스
+                    }},
+
+                    setLabels: function(labels) {{
+                        this._labels = labels;
+                        this._redraw();
+                    }},
+
+                    onAdd: function(map) {{
+                        this._canvas = L.DomUtil.create('canvas', 'compass-label-canvas leaflet-zoom-hide');
+                        this._canvas.style.pointerEvents = 'none';
+                        map.getPane('overlayPane').appendChild(this._canvas);
+                        map.on('moveend zoomend viewreset resize', this._redraw, this);
+                        map.on('mousemove', this._onMouseMove, this);
+                        this._redraw();
+                    }},
+
+                    onRemove: function(map) {{
+                        map.off('moveend zoomend viewreset resize', this._redraw, this);
+                        map.off('mousemove', this._onMouseMove, this);
+                        if (this._hovered >= 0) {{
+                            map.getContainer().style.cursor = '';
+                        }}
+                        L.DomUtil.remove(this._canvas);
+                        this._canvas = null;
+                    }},
+
+                    _redraw: function() {{
+                        var map = this._map;
+                        if (!map || !this._canvas) return;
+                        var size = map.getSize();
+                        var canvas = this._canvas;
+                        L.DomUtil.setPosition(canvas, map.containerPointToLayerPoint([0, 0]));
+                        canvas.width = size.x;
+                        canvas.height = size.y;
+
+                        var ctx = canvas.getContext('2d');
+                        ctx.textAlign = 'center';
+                        ctx.textBaseline = 'middle';
+                        ctx.shadowColor = 'rgba(0, 0, 0, 0.8)';
+
+                        // 라벨 화면 좌표는 마우스 hit-test에 재사용
+                        var labels = this._labels;
+                        var n = labels.lats.length;
+                        this._xs = new Float32Array(n);
+                        this._ys = new Float32Array(n);
+                        for (var i = 0; i < n; i++) {{
+                            var p = map.latLngToContainerPoint([labels.lats[i], labels.lons[i]]);
+                            this._xs[i] = p.x;
+                            this._ys[i] = p.y;
+                            if (p.x < -30 || p.y < -30 || p.x > size.x + 30 || p.y > size.y + 30) continue;
+
+                            if (!labels.isDegree[i]) {{
+                                // 주요 방향 라벨 (N, NE, ...)
+                                ctx.font = "bold 12px 'Courier New', monospace";
+                                ctx.shadowBlur = 3;
+                                ctx.fillStyle = '#00d1b2';
+                                ctx.fillText(labels.texts[i], p.x, p.y);
+                            }} else if (i === this._hovered) {{
+                                // 마우스가 올라간 각도 라벨 강조
+                                ctx.font = "bold 11px 'Courier New', monospace";
+                                var w = ctx.measureText(labels.texts[i]).width + 8;
+                                ctx.shadowBlur = 0;
+                                ctx.fillStyle = 'rgba(0, 209, 178, 0.3)';
+                                ctx.fillRect(p.x - w / 2, p.y - 9, w, 18);
+                                ctx.strokeStyle = '#00d1b2';
+                                ctx.lineWidth = 1;
+                                ctx.strokeRect(p.x - w / 2 + 0.5, p.y - 8.5, w - 1, 17);
+                                ctx.shadowBlur = 2;
+                                ctx.fillStyle = '#ffffff';
+                                ctx.fillText(labels.texts[i], p.x, p.y);
+                            }} else {{
+                                // 30도 간격 각도 라벨
+                                ctx.font = "bold 9px 'Courier New', monospace";
+                                ctx.shadowBlur = 2;
+                                ctx.fillStyle = '#00a896';
+                                ctx.fillText(labels.texts[i], p.x, p.y);
+                            }}
+                        }}
+                    }},
+
+                    // 각도 라벨 위 마우스 hover를 화면 좌표 hit-test로 판정
+                    _onMouseMove: function(e) {{
+                        if (!this._xs) return;
+                        var x = e.containerPoint.x, y = e.containerPoint.y;
+                        var labels = this._labels;
+                        var hovered = -1;
+                        for (var i = 0; i < this._xs.length; i++) {{
+                            if (labels.isDegree[i] && Math.abs(this._xs[i] - x) <= 14 && Math.abs(this._ys[i] - y) <= 7) {{
+                                hovered = i;
+                                break;
                             }}
-                            
-                            layer.bindPopup(popupContent);
                         }}
+                        if (hovered !== this._hovered) {{
+                            this._hovered = hovered;
+                            this._map.getContainer().style.cursor = hovered >= 0 ? 'pointer' : '';
+                            this._redraw();
+                        }}
+                    }}
+                }});
+
+                // 격자 인덱스(위도, 경도)를 하나의 정수 키로 변환 (2^53 이내)
+                function mgrsCacheKey(latIdx, lonIdx) {{
+                    return (latIdx + 90 * MGRS_GRID_STEPS_PER_DEG) * (360 * MGRS_GRID_STEPS_PER_DEG + 1) + (lonIdx + 180 * MGRS_GRID_STEPS_PER_DEG);
+                }}
+
+                function setCoordField(span, text) {{
+                    if (span.textContent !== text) {{
+                        span.textContent = text;
+                    }}
+                }}
+
+                function setCoordsText(lat, lon, mgrs) {{
+                    setCoordField(coordsLatSpan, lat);
+                    setCoordField(coordsLonSpan, lon);
+                    setCoordField(coordsMgrsSpan, mgrs);
+                }}
+
+                function flushMouseCoords() {{
+                    coordsFrameRequested = false;
+                    var latlng = pendingMouseLatLng;
+                    if (!latlng || !coordsDisplay) return;
+                    pendingMouseLatLng = null;
+
+                    // 위경도 문자열은 표시 자릿수(1e-5°)가 바뀐 경우에만 생성
+                    var latE5 = Math.round(latlng.lat * 1e5);
+                    var lonE5 = Math.round(latlng.lng * 1e5);
+                    if (latE5 !== shownLatE5) {{
+                        shownLatE5 = latE5;
+                        coordsLatSpan.textContent = latlng.lat.toFixed(5);
+                    }}
+                    if (lonE5 !== shownLonE5) {{
+                        shownLonE5 = lonE5;
+                        coordsLonSpan.textContent = latlng.lng.toFixed(5);
+                    }}
+
+                    // MGRS 격자는 표시 위경도와 같은 1e-5° 단위 (표시된 위경도와 MGRS가 항상 같은 지점)
+                    var latIdx = Math.round(latlng.lat * MGRS_GRID_STEPS_PER_DEG);
+                    var lonIdx = Math.round(latlng.lng * MGRS_GRID_STEPS_PER_DEG);
+                    var key = mgrsCacheKey(latIdx, lonIdx);
+                    if (key === displayedMgrsKey) return;  // 같은 MGRS 격자는 다시 조회하지 않음
+                    displayedMgrsKey = key;
+
+                    var mgrsCoord = cachedMgrsCoords.get(key);
+                    setCoordField(coordsMgrsSpan, mgrsCoord || '계산 중...');
+
+                    // 캐시에 없는 좌표만 Python에 개별 변환 요청 (비동기, 같은 격자는 한 번만)
+                    if (backend && mgrsCoord === undefined && key !== lastMgrsRequestKey) {{
+                        lastMgrsRequestKey = key;
+                        backend.convert_single_mgrs(latIdx / MGRS_GRID_STEPS_PER_DEG, lonIdx / MGRS_GRID_STEPS_PER_DEG, key);
+                    }}
+                }}
+
+                var GEOJSON_STYLE_COLORS = {{
+                    'apt': '#ff6b6b',    // 빨강 - Airport
+                    'nav': '#4ecdc4',    // 청록 - Navigation
+                    'obs': '#ffe66d',    // 노랑 - Obstacle
+                    'raa': '#ff69b4',    // 핫핑크 - Restricted Area (더 눈에 띄는 색상)
+                    'rca': '#ffd3b6'     // 주황 - R-Class Area
+                }};
+                var GEOJSON_BATCH_SIZE = 500;  // 유휴 콜백 1회당 추가할 feature 수
+                var geoJsonLoads = {{}};  // 스트리밍 중인 레이어: {{ queue, ended, color, zones, zoneLayers }}
+
+                var scheduleIdle = window.requestIdleCallback
+                    ? function(callback) {{ return window.requestIdleCallback(callback, {{ timeout: 50 }}); }}
+                    : function(callback) {{ return setTimeout(callback, 0); }};
+
+                // 공항 feature로 관제권 데이터/라벨 누적 (LatLng 객체 없이 좌표 배열에 직접 기록)
+                function addControlZones(load, features) {{
+                    var zones = load.zones;
+                    for (var i = 0; i < features.length; i++) {{
+                        var feature = features[i];
+                        if (feature.geometry && feature.geometry.type === 'Point') {{
+                            var coords = feature.geometry.coordinates;
+
+                            // 공항 정보 라벨 생성
+                            var airportName = feature.properties.name || '공항';
+                            var icaoCode = feature.properties.icaoCode || '';
+                            var labelText = airportName + (icaoCode ? ' (' + icaoCode + ')' : '');
+
+                            zones.lats.push(coords[1]);
+                            zones.lons.push(coords[0]);
+                            zones.radiiMeters.push(CONTROL_ZONE_RADIUS_M);
+                            zones.labels.push(labelText);
+
+                            addControlZoneLabel(load, coords[1], coords[0], labelText);
+                        }}
+                    }}
+                }}
+
+                // 공항 라벨 마커 생성 (클릭 시 공항 정보 표시)
+                function addControlZoneLabel(load, lat, lon, labelText) {{
+                    var controlZoneLabel = L.marker([lat, lon], {{
+                        icon: L.divIcon({{
+                            className: 'control-zone-label',
+                            html: '<div class="ctl-zone-label">' + labelText + '</div>',
+                            iconSize: null,
+                            iconAnchor: [0, -20]
+                        }})
                     }});
-                    
+
+                    controlZoneLabel.on('click', function() {{
+                        openAirportPopup(lat, lon);
+                    }});
+
+                    // 관제권 그룹은 로드 완료 시 한 번에 구성
+                    load.zoneLayers.push(controlZoneLabel);
+                }}
+
+                // GeoJSON 레이어 스트리밍 시작: 빈 레이어를 만들고 feature는 배치로 추가
+                window.beginGeoJsonLayer = function(layerName) {{
+                    debugLog('GeoJSON 레이어 로드 시작:', layerName);
+
+                    var color = GEOJSON_STYLE_COLORS[layerName] || '#888888';
+                    // 레이어별로 미리 만들어 둔 팝업 빌더 선택 (피처마다 레이어 분기를 반복하지 않음)
+                    var popupSpec = {{ build: popupBuilders[layerName] || defaultPopupBuilder, color: color }};
+
+                    var load = {{ queue: [], ended: false, scheduled: false, count: 0, color: color, zones: null, zoneLayers: null }};
+
+                    // 공항인 경우 관제권 데이터 누적 준비
+                    if (layerName === 'apt') {{
+                        // 관제권 원형은 단일 Canvas 오버레이에 그리고, 라벨만 마커로 유지
+                        load.zones = {{ lats: [], lons: [], radiiMeters: [], labels: [] }};
+                        load.zoneLayers = [];
+                    }}
+
+                    // Polygon/Polyline 스타일은 레이어별로 한 번만 만들어 모든 피처가 공유 (setStyle이 값을 복사)
+                    var featureStyle = {{
+                        color: color,
+                        weight: 3,
+                        opacity: 1.0,
+                        fill: true,
+                        fillColor: color,
+                        fillOpacity: 0.4
+                    }};
+
+                    var geoJsonLayer = L.geoJSON(null, {{
+                        renderer: canvasRenderer,
+                        style: function() {{
+                            return featureStyle;
+                        }},
+                        pointToLayer: function(feature, latlng) {{
+                            // DOM 마커 대신 공유 캔버스에 원으로 표시 (외곽 지름 16px, 검은 테두리)
+                            return L.circleMarker(latlng, {{
+                                renderer: canvasRenderer,
+                                radius: 7,
+                                weight: 2,
+                                color: '#000',
+                                opacity: 1.0,
+                                fillColor: color,
+                                fillOpacity: 1.0
+                            }});
+                        }},
+                        onEachFeature: function(feature, layer) {{
+                            bindLazyPopup(layer, popupSpec);
+                            // 관제권 클릭 시 O(1)로 공항 팝업을 찾도록 좌표 인덱스 구성
+                            if (layerName === 'apt' && layer.getLatLng) {{
+                                var latlng = layer.getLatLng();
+                                aptLayerByKey.set(airportKey(latlng.lat, latlng.lng), layer);
+                            }}
+                        }}
+                    }});
+
                     // GeoJSON 레이어를 기본적으로 숨김 상태로 로드
                     // geoJsonLayer.addTo(map);  // 기본 렌더 비활성화
-                    
+
                     // 모든 레이어를 GeoJSON 레이어만 저장 (관제권 분리)
                     geoJsonLayers[layerName] = geoJsonLayer;
-                    
                     geoJsonVisible[layerName] = false;  // 기본값을 false로 변경
-                    console.log('GeoJSON 레이어 로드 완료 (숨김 상태):', layerName);
+                    geoJsonLoads[layerName] = load;
+                }};
+
+                // feature 배치를 큐에 쌓고 유휴 시간에 처리하도록 예약
+                window.pushGeoJsonFeatures = function(layerName, features) {{
+                    var load = geoJsonLoads[layerName];
+                    if (!load) {{
+                        console.error('GeoJSON 레이어가 시작되지 않음:', layerName);
+                        return;
+                    }}
+                    for (var i = 0; i < features.length; i++) {{
+                        load.queue.push(features[i]);
+                    }}
+                    scheduleGeoJsonBatch(layerName, load);
+                }};
+
+                window.endGeoJsonLayer = function(layerName) {{
+                    var load = geoJsonLoads[layerName];
+                    if (!load) return;
+                    load.ended = true;
+                    scheduleGeoJsonBatch(layerName, load);
+                }};
+
+                function onGeoJsonMessage(op, layerName, features) {{
+                    if (op === 'push') {{
+                        pushGeoJsonFeatures(layerName, features);
+                    }} else if (op === 'begin') {{
+                        beginGeoJsonLayer(layerName);
+                    }} else if (op === 'end') {{
+                        endGeoJsonLayer(layerName);
+                    }}
+                }}
+
+                function scheduleGeoJsonBatch(layerName, load) {{
+                    if (load.scheduled) return;
+                    load.scheduled = true;
+                    scheduleIdle(function() {{
+                        load.scheduled = false;
+                        processGeoJsonBatch(layerName, load);
+                    }});
+                }}
+
+                // 배치 하나만 레이어에 추가하고 나머지는 다음 유휴 시간으로 양보
+                function processGeoJsonBatch(layerName, load) {{
+                    try {{
+                        var batch = load.queue.splice(0, GEOJSON_BATCH_SIZE);
+                        if (batch.length > 0) {{
+                            geoJsonLayers[layerName].addData({{ type: 'FeatureCollection', features: batch }});
+                            if (load.zones) {{
+                                addControlZones(load, batch);
+                            }}
+                            load.count += batch.length;
+                        }}
                     }} catch (e) {{
                         console.error('GeoJSON 레이어 로드 오류:', layerName, e);
                     }}
-                }};
-                
+
+                    if (load.queue.length > 0) {{
+                        scheduleGeoJsonBatch(layerName, load);
+                    }} else if (load.ended) {{
+                        finishGeoJsonLayer(layerName, load);
+                    }}
+                }}
+
+                function finishGeoJsonLayer(layerName, load) {{
+                    if (load.zones) {{
+                        load.zoneLayers.push(new ControlZoneCanvasLayer({{
+                            lats: new Float64Array(load.zones.lats),
+                            lons: new Float64Array(load.zones.lons),
+                            radiiMeters: new Float32Array(load.zones.radiiMeters),
+                            labels: load.zones.labels
+                        }}));
+
+                        // 지도에 붙기 전에 배열로 한 번에 그룹 구성 후 관제권 레이어 저장
+                        var controlZoneGroup = L.layerGroup(load.zoneLayers);
+                        controlZoneLayers[layerName] = controlZoneGroup;
+                        if (controlZoneVisible) {{
+                            controlZoneGroup.addTo(map);
+                        }}
+                    }}
+                    delete geoJsonLoads[layerName];
+                    debugLog('GeoJSON 레이어 로드 완료 (숨김 상태):', layerName, 'features:', load.count);
+                }}
+
                 // GeoJSON 레이어 토글
                 window.toggleGeoJsonLayer = function(layerName) {{
                     if (!geoJsonLayers[layerName]) {{
@@ -1083,27 +2151,44 @@ class TacticalMapView(QWebEngineView):
                     return compassVisible;
                 }};
 
+                // 나침반 라벨 단위원 오프셋 테이블 (0°=북쪽, 시계 방향; 반경 배율 포함)
+                // 8개 주요 방향 라벨은 반경의 1.15배, 45° 배수가 아닌 30° 간격 각도 라벨은 원 위에 표시
+                var COMPASS_LABELS = (function() {{
+                    var directionLabels = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'];
+                    var texts = [], isDegree = [], north = [], east = [];
+                    function addLabel(angle, text, degree, distance) {{
+                        // 올바른 각도 계산: 0°=북쪽(위), 90°=동쪽(오른쪽), 180°=남쪽(아래), 270°=서쪽(왼쪽)
+                        var rad = (90 - angle) * Math.PI / 180;
+                        texts.push(text);
+                        isDegree.push(degree);
+                        north.push(Math.sin(rad) * distance);
+                        east.push(Math.cos(rad) * distance);
+                    }}
+                    for (var i = 0; i < directionLabels.length; i++) {{
+                        addLabel(i * 45, directionLabels[i], 0, 1.15);
+                    }}
+                    for (var angle = 0; angle < 360; angle += 30) {{
+                        if (angle % 45 === 0) continue;  // 주요 방향은 이미 라벨이 있음
+                        addLabel(angle, angle + '°', 1, 1.0);
+                    }}
+                    return {{
+                        texts: texts,
+                        isDegree: new Uint8Array(isDegree),
+                        north: new Float64Array(north),
+                        east: new Float64Array(east)
+                    }};
+                }})();
+                var COMPASS_LABEL_COUNT = COMPASS_LABELS.texts.length;
+
                 // 나침반 그리기 함수
                 function drawCompass() {{
-                    // 기존 나침반 마커 제거
-                    for (var wpId in compassMarkers) {{
-                        if (compassMarkers[wpId]) {{
-                            map.removeLayer(compassMarkers[wpId]);
-                        }}
+                    // 기존 원/라벨 레이어는 재사용하고 위치·반경만 갱신
+                    if (!compassLayerGroup) {{
+                        compassLayerGroup = L.layerGroup();
+                    }}
+                    if (!map.hasLayer(compassLayerGroup)) {{
+                        compassLayerGroup.addTo(map);
                     }}
-                    compassMarkers = {{}};
-
-                    // 기존 나침반 라벨 모두 제거 (방향 라벨 + 각도 라벨 + 내부 원) - 잔상 방지
-                    map.eachLayer(function(layer) {{
-                        if (layer instanceof L.Marker && layer.getIcon() && 
-                            (layer.getIcon().options.className === 'compass-direction-label' || 
-                             layer.getIcon().options.className === 'compass-degree-label')) {{
-                            map.removeLayer(layer);
-                        }}
-                        if (layer instanceof L.Circle && layer.options.dashArray === '3, 3') {{
-                            map.removeLayer(layer);
-                        }}
-                    }});
 
                     // 줌 레벨에 따라 나침반 크기 조정
                     var zoomLevel = map.getZoom();
@@ -1117,193 +2202,186 @@ class TacticalMapView(QWebEngineView):
                         compassRadius = baseRadius * 1.5; // 확대 줌에서는 더 크게
                     }}
 
-                    waypoints.forEach(function(wp) {{
-                        // 각 웨이포인트마다 나침반(각도기) 원형 오버레이 생성
-                        var compassCircle = L.circle([wp.lat, wp.lon], {{
-                            radius: compassRadius,
-                            color: '#00d1b2',
-                            weight: 2,
-                            opacity: 0.7,
-                            fill: false,
-                            dashArray: '5, 5'
-                        }});
-
-                        // 8개 주요 방향: N, NE, E, SE, S, SW, W, NW
-                        var directions = [
-                            {{ angle: 0, label: 'N' }},
-                            {{ angle: 45, label: 'NE' }},
-                            {{ angle: 90, label: 'E' }},
-                            {{ angle: 135, label: 'SE' }},
-                            {{ angle: 180, label: 'S' }},
-                            {{ angle: 225, label: 'SW' }},
-                            {{ angle: 270, label: 'W' }},
-                            {{ angle: 315, label: 'NW' }}
-                        ];
-
-                        // 주요 방향 라벨 표시
-                        directions.forEach(function(dir) {{
-                            // 올바른 각도 계산: 0°=북쪽(위), 90°=동쪽(오른쪽), 180°=남쪽(아래), 270°=서쪽(왼쪽)
-                            var rad = (90 - dir.angle) * Math.PI / 180;
-                            var distance = compassRadius * 1.15; // 반경보다 조금 더 바깥에 표시
-                            var lat = wp.lat + (Math.sin(rad) * distance / 111000); // 위도 변환
-                            var lon = wp.lon + (Math.cos(rad) * distance / (111000 * Math.cos(wp.lat * Math.PI / 180))); // 경도 변환
-
-                            var marker = L.marker([lat, lon], {{
-                                icon: L.divIcon({{
-                                    className: 'compass-direction-label',
-                                    html: '<div style="background: transparent; color: #00d1b2; padding: 2px 6px; font-size: 12px; font-weight: bold; border: none; border-radius: 2px; pointer-events: none; font-family: Courier New, monospace; text-shadow: 0 0 3px rgba(0,0,0,0.8);">' + dir.label + '</div>',
-                                    iconSize: null,
-                                    iconAnchor: [12, 12]
-                                }})
+                    // 방향/각도 라벨은 위치만 모아 두었다가 캔버스 레이어 하나로 그림
+                    var labelCount = waypoints.len * COMPASS_LABEL_COUNT;
+                    var labelLats = new Float64Array(labelCount);
+                    var labelLons = new Float64Array(labelCount);
+                    var labelTexts = new Array(labelCount);
+                    var labelIsDegree = new Uint8Array(labelCount);
+                    var latScale = compassRadius / 111000;  // 미터 → 위도(도)
+
+                    for (var w = 0; w < waypoints.len; w++) {{
+                        var wpLat = waypoints.lats[w];
+                        var wpLon = waypoints.lons[w];
+
+                        // 각 웨이포인트마다 나침반(각도기) 원형 오버레이 (+ 반경 표시용 내부 원)
+                        if (w < compassPool.outer.length) {{
+                            compassPool.outer[w].setLatLng([wpLat, wpLon]).setRadius(compassRadius);
+                            compassPool.inner[w].setLatLng([wpLat, wpLon]).setRadius(compassRadius / 2);
+                        }} else {{
+                            var compassCircle = L.circle([wpLat, wpLon], {{
+                                renderer: canvasRenderer,
+                                radius: compassRadius,
+                                color: '#00d1b2',
+                                weight: 2,
+                                opacity: 0.7,
+                                fill: false,
+                                dashArray: '5, 5'
                             }});
-                            marker.addTo(map);
-                        }});
-
-                        // 30도마다 각도 마크 추가 (숫자 표시)
-                        for (var angle = 0; angle < 360; angle += 30) {{
-                            // 주요 방향(8개)은 이미 라벨이 있으므로 건너뛰기
-                            if (angle % 45 === 0) continue;
-                            
-                            var rad = (90 - angle) * Math.PI / 180;
-                            var markDistance = compassRadius * 1.0; // 원 위에 표시
-                            var lat = wp.lat + (Math.sin(rad) * markDistance / 111000);
-                            var lon = wp.lon + (Math.cos(rad) * markDistance / (111000 * Math.cos(wp.lat * Math.PI / 180)));
-
-                            var markerDiv = L.divIcon({{
-                                className: 'compass-degree-label',
-                                html: '<div style="background: transparent; color: #00a896; padding: 0px 2px; font-size: 9px; font-weight: bold; border: none; pointer-events: auto; cursor: pointer; font-family: Courier New, monospace; text-shadow: 0 0 2px rgba(0,0,0,0.8); transition: all 0.2s;" data-angle="' + angle + '">' + angle + '°</div>',
-                                iconSize: null,
-                                iconAnchor: [10, 10]
+                            var innerCircle = L.circle([wpLat, wpLon], {{
+                                renderer: canvasRenderer,
+                                radius: compassRadius / 2,
+                                color: '#00d1b2',
+                                weight: 1,
+                                opacity: 0.3,
+                                fill: false,
+                                dashArray: '3, 3'
                             }});
+                            compassPool.outer.push(compassCircle);
+                            compassPool.inner.push(innerCircle);
+                            compassLayerGroup.addLayer(innerCircle).addLayer(compassCircle);
+                        }}
 
-                            var marker = L.marker([lat, lon], {{ icon: markerDiv }});
-                            
-                            // 호버 이벤트 추가
-                            marker.on('mouseover', function(e) {{
-                                var el = e.target._icon.querySelector('div');
-                                if (el) {{
-                                    el.style.background = 'rgba(0, 209, 178, 0.3)';
-                                    el.style.fontSize = '11px';
-                                    el.style.padding = '2px 4px';
-                                    el.style.borderRadius = '4px';
-                                    el.style.border = '1px solid #00d1b2';
-                                    el.style.color = '#ffffff';
-                                }}
-                            }});
-                            
-                            marker.on('mouseout', function(e) {{
-                                var el = e.target._icon.querySelector('div');
-                                if (el) {{
-                                    el.style.background = 'transparent';
-                                    el.style.fontSize = '9px';
-                                    el.style.padding = '0px 2px';
-                                    el.style.borderRadius = '2px';
-                                    el.style.border = 'none';
-                                    el.style.color = '#00a896';
-                                }}
-                            }});
-                            
-                            marker.addTo(map);
+                        // 주요 방향/각도 라벨 위치: 고정 단위원 오프셋 × 웨이포인트별 미터→도 배율
+                        var lonScale = compassRadius / (111000 * Math.cos(wpLat * Math.PI / 180));
+                        for (var k = 0; k < COMPASS_LABEL_COUNT; k++) {{
+                            var idx = w * COMPASS_LABEL_COUNT + k;
+                            labelLats[idx] = wpLat + COMPASS_LABELS.north[k] * latScale;
+                            labelLons[idx] = wpLon + COMPASS_LABELS.east[k] * lonScale;
+                            labelTexts[idx] = COMPASS_LABELS.texts[k];
+                            labelIsDegree[idx] = COMPASS_LABELS.isDegree[k];
                         }}
 
-                        // 내부 원 (반경 표시용, 선택사항)
-                        var innerCircle = L.circle([wp.lat, wp.lon], {{
-                            radius: compassRadius / 2,
-                            color: '#00d1b2',
-                            weight: 1,
-                            opacity: 0.3,
-                            fill: false,
-                            dashArray: '3, 3'
-                        }});
-                        innerCircle.addTo(map);
+                    }}
 
-                        compassCircle.addTo(map);
-                        compassMarkers[wp.wp_id] = compassCircle;
-                    }});
+                    // 웨이포인트가 줄었으면 남는 원 제거
+                    while (compassPool.outer.length > waypoints.len) {{
+                        compassLayerGroup.removeLayer(compassPool.outer.pop());
+                        compassLayerGroup.removeLayer(compassPool.inner.pop());
+                    }}
+
+                    var labels = {{
+                        lats: labelLats,
+                        lons: labelLons,
+                        texts: labelTexts,
+                        isDegree: labelIsDegree
+                    }};
+                    if (compassPool.labels) {{
+                        compassPool.labels.setLabels(labels);
+                    }} else {{
+                        compassPool.labels = new CompassLabelCanvasLayer(labels);
+                        compassLayerGroup.addLayer(compassPool.labels);
+                    }}
                 }}
 
                 // 나침반 제거 함수
                 function removeCompass() {{
-                    for (var wpId in compassMarkers) {{
-                        if (compassMarkers[wpId]) {{
-                            map.removeLayer(compassMarkers[wpId]);
-                        }}
+                    // 나침반 원 + 방향/각도 라벨 + 내부 원을 그룹 단위로 제거 (레이어는 재사용 위해 보관)
+                    if (compassLayerGroup) {{
+                        map.removeLayer(compassLayerGroup);
                     }}
-                    compassMarkers = {{}};
-
-                    // 모든 나침반 라벨 제거 (방향 라벨 + 각도 라벨 + 내부 원)
-                    map.eachLayer(function(layer) {{
-                        if (layer instanceof L.Marker && layer.getIcon() && 
-                            (layer.getIcon().options.className === 'compass-direction-label' || 
-                             layer.getIcon().options.className === 'compass-degree-label')) {{
-                            map.removeLayer(layer);
-                        }}
-                        if (layer instanceof L.Circle && layer.options.dashArray === '3, 3') {{
-                            // 내부 원 제거
-                            map.removeLayer(layer);
-                        }}
-                    }});
                 }}
 
                 function addWaypoints() {{
                     // 기존 마커 제거
-                    Object.keys(markers).forEach(id => map.removeLayer(markers[id]));
-                    markers = {{}};
-
-                    waypoints.forEach(function(wp) {{
-                        var iconUrl = symbols[wp.wp_id] || '';
-                        var icon = L.icon({{
-                            iconUrl: iconUrl,
-                            iconSize: [35, 35],
-                            iconAnchor: [17, 17],
-                            popupAnchor: [0, -17]
-                        }});
+                    markers.forEach(function(marker) {{ map.removeLayer(marker); }});
+                    markers.clear();
+
+                    // 마커 추가와 함께 웨이포인트 범위(bounds) 누적
+                    var minLat = Infinity, maxLat = -Infinity, minLon = Infinity, maxLon = -Infinity;
+                    var labelTexts = new Array(waypoints.len);
+                    for (var i = 0; i < waypoints.len; i++) {{
+                        addWaypointMarker(i);
+                        labelTexts[i] = waypointLabelText(i);
+                        var lat = waypoints.lats[i], lon = waypoints.lons[i];
+                        if (lat < minLat) minLat = lat;
+                        if (lat > maxLat) maxLat = lat;
+                        if (lon < minLon) minLon = lon;
+                        if (lon > maxLon) maxLon = lon;
+                    }}
+                    waypointBounds = waypoints.len > 0
+                        ? L.latLngBounds([minLat, minLon], [maxLat, maxLon])
+                        : null;
 
-                        var marker = L.marker([wp.lat, wp.lon], {{
-                            icon: icon,
-                            draggable: true
-                        }}).addTo(map);
+                    if (!waypointLabelLayer) {{
+                        waypointLabelLayer = new WaypointLabelCanvasLayer().addTo(map);
+                    }}
+                    waypointLabelLayer.setTexts(labelTexts);
 
-                        // 마커 우클릭 이벤트 (편집/삭제)
-                        marker.on('contextmenu', function(e) {{
-                            L.DomEvent.preventDefault(e);    // 브라우저 기본 메뉴 방지
-                            L.DomEvent.stopPropagation(e);   // 지도 클릭 이벤트로 전파 방지
-                            if (backend) {{
-                                backend.on_waypoint_right_click(wp.wp_id);
-                            }}
-                        }});
+                    drawRoute();
+                }}
 
-                        // 마커 드래그 이벤트 (위치 이동)
-                        marker.on('dragend', function(e) {{
-                            var newPos = e.target.getLatLng();
-                            if (backend) {{
-                                backend.on_waypoint_moved(wp.wp_id, newPos.lat, newPos.lng);
-                            }}
-                        }});
+                function addWaypointMarker(i) {{
+                    var wpId = waypoints.ids[i];
+                    var icon = L.icon({{
+                        iconUrl: symbols.get(waypoints.taskCodes[i]) || '',
+                        iconSize: [35, 35],
+                        iconAnchor: [17, 17],
+                        popupAnchor: [0, -17]
+                    }});
 
-                        // 웨이포인트 간단 라벨 표시 (거리 포함)
-                        var distanceText = wp.distance > 0 ? " | " + wp.distance + "km" : "";
-                        var wpName = wp.name ? wp.name : "WP-" + (waypoints.indexOf(wp) + 1);
-                        var labelText = wpName + " | " + wp.task_code + " | " + wp.alt + "m | " + wp.speed + "km/h" + distanceText;
-                        marker.bindTooltip(labelText, {{
-                            permanent: true,
-                            direction: 'right',
-                            offset: [20, 0],
-                            className: 'waypoint-label',
-                            sticky: false
-                        }});
+                    var marker = L.marker([waypoints.lats[i], waypoints.lons[i]], {{
+                        icon: icon,
+                        draggable: true
+                    }}).addTo(map);
 
-                        markers[wp.wp_id] = marker;
+                    // 마커 우클릭 이벤트 (편집/삭제)
+                    marker.on('contextmenu', function(e) {{
+                        L.DomEvent.preventDefault(e);    // 브라우저 기본 메뉴 방지
+                        L.DomEvent.stopPropagation(e);   // 지도 클릭 이벤트로 전파 방지
+                        if (backend) {{
+                            backend.on_waypoint_right_click(wpId);
+                        }}
                     }});
 
-                    drawRoute();
+                    // 마커 드래그 이벤트 (위치 이동)
+                    // 마지막으로 보낸 위치에서 거의 움직이지 않았으면(미세 조정) 백엔드 호출 생략
+                    var lastLatLng = marker.getLatLng();
+                    marker.on('dragend', function(e) {{
+                        var newPos = e.target.getLatLng();
+                        if (Math.abs(newPos.lat - lastLatLng.lat) < DRAG_MOVE_EPSILON_DEG &&
+                            Math.abs(newPos.lng - lastLatLng.lng) < DRAG_MOVE_EPSILON_DEG) {{
+                            // 원래 위치로 되돌려 지도와 미션 데이터가 어긋나지 않게 함
+                            e.target.setLatLng(lastLatLng);
+                            waypoints.lats[i] = lastLatLng.lat;
+                            waypoints.lons[i] = lastLatLng.lng;
+                            if (waypointLabelLayer) waypointLabelLayer.redraw();
+                            return;
+                        }}
+                        lastLatLng = newPos;
+                        if (backend) {{
+                            backend.on_waypoint_moved(wpId, newPos.lat, newPos.lng);
+                        }}
+                    }});
+
+                    // 드래그 중에도 캔버스 라벨이 마커를 따라가도록 위치 반영
+                    marker.on('drag', function(e) {{
+                        var pos = e.target.getLatLng();
+                        waypoints.lats[i] = pos.lat;
+                        waypoints.lons[i] = pos.lng;
+                        if (waypointLabelLayer) waypointLabelLayer.redraw();
+                    }});
+
+                    markers.set(wpId, marker);
+                }}
+
+                // 웨이포인트 간단 라벨 문자열 (거리 포함)
+                function waypointLabelText(i) {{
+                    var distance = waypoints.distances[i];
+                    var distanceText = distance > 0 ? " | " + distance + "km" : "";
+                    var wpName = waypoints.names[i] ? waypoints.names[i] : "WP-" + (i + 1);
+                    return wpName + " | " + waypoints.taskCodes[i] + " | " + waypoints.alts[i] + "m | " + waypoints.speeds[i] + "km/h" + distanceText;
                 }}
 
                 function drawRoute() {{
                     if (polyline) map.removeLayer(polyline);
-                    var coords = waypoints.map(wp => [wp.lat, wp.lon]);
+                    var coords = new Array(waypoints.len);
+                    for (var i = 0; i < waypoints.len; i++) {{
+                        coords[i] = [waypoints.lats[i], waypoints.lons[i]];
+                    }}
                     if (coords.length > 0) {{
                         polyline = L.polyline(coords, {{
+                            renderer: canvasRenderer,
                             color: '#00d1b2',
                             weight: 3,
                             opacity: 0.8,
@@ -1313,10 +2391,42 @@ class TacticalMapView(QWebEngineView):
                 }}
 
                 // 외부(Python)에서 호출하는 지도 갱신 함수
+                // Python Waypoint.to_wire() 압축 배열 목록을 필드별 병렬 배열(SoA)로 복원
+                function decodeWaypoints(rows) {{
+                    var n = rows.length;
+                    var wps = {{
+                        len: n,
+                        ids: new Array(n),
+                        lats: new Float64Array(n),
+                        lons: new Float64Array(n),
+                        alts: new Float64Array(n),
+                        speeds: new Float64Array(n),
+                        distances: new Float64Array(n),
+                        taskCodes: new Array(n),
+                        names: new Array(n)
+                    }};
+                    for (var i = 0; i < n; i++) {{
+                        var row = rows[i];
+                        var task = row[4];
+                        wps.ids[i] = row[0];
+                        wps.lats[i] = row[1];
+                        wps.lons[i] = row[2];
+                        wps.alts[i] = row[3];
+                        wps.taskCodes[i] = typeof task === 'number' ? TASK_CODES[task] : task;
+                        wps.speeds[i] = row[5];
+                        wps.distances[i] = row[6];
+                        wps.names[i] = row[7];
+                    }}
+                    return wps;
+                }}
+
                 window.refreshMap = function(newWaypoints, newSymbols, fitBounds) {{
-                    waypoints = newWaypoints;
+                    waypoints = decodeWaypoints(newWaypoints);
                     if (newSymbols) {{
-                        symbols = newSymbols;
+                        // 작업 코드별 아이콘은 변하지 않으므로 기존 항목에 병합
+                        for (var code in newSymbols) {{
+                            symbols.set(code, newSymbols[code]);
+                        }}
                     }}
                     addWaypoints();
 
@@ -1325,11 +2435,46 @@ class TacticalMapView(QWebEngineView):
                         drawCompass();
                     }}
 
-                    if (fitBounds && waypoints.length > 0) {{
-                        var group = new L.featureGroup(Object.values(markers));
-                        map.fitBounds(group.getBounds(), {{ padding: [50, 50] }});
+                    if (fitBounds && waypointBounds) {{
+                        map.fitBounds(waypointBounds, {{ padding: [50, 50] }});
+                    }}
+                }};
+
+                // 웨이포인트 하나만 이동했을 때의 부분 갱신 (Python refresh_waypoint_delta)
+                window.updateWaypointDelta = function(delta) {{
+                    var i = delta.index;
+                    if (i >= waypoints.len || waypoints.ids[i] !== delta.id) return;
+
+                    waypoints.lats[i] = delta.lat;
+                    waypoints.lons[i] = delta.lon;
+                    for (var k = 0; k < delta.distances.length; k++) {{
+                        waypoints.distances[delta.distances[k][0]] = delta.distances[k][1];
+                    }}
+
+                    var marker = markers.get(delta.id);
+                    if (marker) marker.setLatLng([delta.lat, delta.lon]);
+
+                    // 거리가 바뀐 구간의 라벨만 다시 만들고 캔버스는 한 번만 그림
+                    if (waypointLabelLayer) {{
+                        var texts = waypointLabelLayer._texts;
+                        for (var k = 0; k < delta.distances.length; k++) {{
+                            var j = delta.distances[k][0];
+                            texts[j] = waypointLabelText(j);
+                        }}
+                        texts[i] = waypointLabelText(i);
+                        waypointLabelLayer.redraw();
+                    }}
+
+                    drawRoute();
+                    if (compassVisible) {{
+                        drawCompass();
                     }}
                 }};
+
+                // Python에서 한 번에 전달하는 갱신 데이터 (waypoints, symbols, fitBounds)
+                window.refreshMapPayload = function(payload) {{
+                    refreshMap(payload.waypoints, payload.symbols, payload.fitBounds);
+                }};
                 
                 // 미션 정보 업데이트 함수
                 window.updateMissionInfo = function(missionData) {{
@@ -1371,19 +2516,18 @@ class TacticalMapView(QWebEngineView):
                         mgrsGridVisible = true;
                         // 맵 이동/줌 시 그리드 자동 업데이트
                         map.on('zoomend moveend', updateMGRSGridIfVisible);
+                        map.on('movestart zoomstart', fadeMGRSGrid);
                     }}
                 }};
 
                 function drawMGRSGrid() {{
-                    if (mgrsGridLayer) {{
-                        map.removeLayer(mgrsGridLayer);
+                    // 기존 라벨 제거 (새 MGRS 데이터가 오면 다시 채움)
+                    if (mgrsLabelLayer) {{
+                        mgrsLabelLayer.setLabels({{ lats: [], lons: [], texts: [] }});
                     }}
-                    // 기존 라벨 제거
-                    mgrsLabels.forEach(label => map.removeLayer(label));
-                    mgrsLabels = [];
 
                     var bounds = map.getBounds();
-                    var lines = [];
+                    var segments = [];  // 격자선 양 끝점 [[lat, lon], [lat, lon]]
 
                     // 줌 레벨에 따라 그리드 간격 결정
                     var zoomLevel = map.getZoom();
@@ -1392,51 +2536,34 @@ class TacticalMapView(QWebEngineView):
                     else if (zoomLevel < 8) gridSpacing = 2;
                     else if (zoomLevel > 12) gridSpacing = 0.5;
 
-                    // 위도 그리드: gridSpacing마다 선 그리기
-                    var lat = Math.ceil(bounds.getSouth() / gridSpacing) * gridSpacing;
-                    var latLines = [];
-                    while (lat <= bounds.getNorth()) {{
-                        latLines.push(lat);
-                        lat += gridSpacing;
+                    // 위도/경도 그리드: gridSpacing의 정수배마다 선 그리기
+                    // (실수 누적 대신 정수 인덱스 × 간격으로 계산해 반복 횟수·좌표가 정확히 고정됨)
+                    var latStart = Math.ceil(bounds.getSouth() / gridSpacing);
+                    var latCount = Math.max(0, Math.floor(bounds.getNorth() / gridSpacing) - latStart + 1);
+                    var latLines = new Array(latCount);
+                    for (var k = 0; k < latCount; k++) {{
+                        latLines[k] = (latStart + k) * gridSpacing;
                     }}
 
-                    // 경도 그리드: gridSpacing마다 선 그리기
-                    var lon = Math.ceil(bounds.getWest() / gridSpacing) * gridSpacing;
-                    var lonLines = [];
-                    while (lon <= bounds.getEast()) {{
-                        lonLines.push(lon);
-                        lon += gridSpacing;
+                    var lonStart = Math.ceil(bounds.getWest() / gridSpacing);
+                    var lonCount = Math.max(0, Math.floor(bounds.getEast() / gridSpacing) - lonStart + 1);
+                    var lonLines = new Array(lonCount);
+                    for (var k = 0; k < lonCount; k++) {{
+                        lonLines[k] = (lonStart + k) * gridSpacing;
                     }}
 
-                    // 격자선 그리기 (위도)
+                    // 웹 메르카토르(EPSG:3857)에서 위도선/경도선은 직선이므로 양 끝점 2개면 충분
+                    var west = bounds.getWest(), east = bounds.getEast();
+                    var south = bounds.getSouth(), north = bounds.getNorth();
+
+                    // 격자선 그리기 (위도/경도)
                     latLines.forEach(function(lat) {{
-                        var latLngs = [];
-                        for (var lon = bounds.getWest(); lon <= bounds.getEast(); lon += 0.1) {{
-                            latLngs.push([lat, lon]);
-                        }}
-                        var line = L.polyline(latLngs, {{
-                            color: '#00ff00',
-                            weight: 1.5,
-                            opacity: 0.6,
-                            dashArray: '5, 5'
-                        }});
-                        lines.push(line);
+                        segments.push([[lat, west], [lat, east]]);
                     }});
-
-                    // 격자선 그리기 (경도)
                     lonLines.forEach(function(lon) {{
-                        var latLngs = [];
-                        for (var lat = bounds.getSouth(); lat <= bounds.getNorth(); lat += 0.1) {{
-                            latLngs.push([lat, lon]);
-                        }}
-                        var line = L.polyline(latLngs, {{
-                            color: '#00ff00',
-                            weight: 1.5,
-                            opacity: 0.6,
-                            dashArray: '5, 5'
-                        }});
-                        lines.push(line);
+                        segments.push([[south, lon], [north, lon]]);
                     }});
+                    syncMGRSGridLines(segments);
 
                     // Python으로 MGRS 변환 요청 (grid cell 중심 좌표들)
                     var mgrsRequests = [];
@@ -1450,57 +2577,132 @@ class TacticalMapView(QWebEngineView):
                         }}
                     }}
 
-                    // Python 백엔드에 MGRS 변환 요청
-                    if (backend && mgrsRequests.length > 0) {{
+                    // 같은 간격/범위의 그리드는 이전 변환 결과를 재사용 (백엔드 호출 생략)
+                    var gridKey = mgrsGridCacheKey(gridSpacing, latLines, lonLines);
+                    if (mgrsGridCache[gridKey]) {{
+                        window.mgrsGridData = mgrsGridCache[gridKey];
+                        addMGRSLabels(gridCenters);
+                    }} else if (backend && mgrsRequests.length > 0) {{
+                        // Python 백엔드에 MGRS 변환 요청 (결과는 receiveMGRSGridData로 비동기 도착)
                         window.pendingGridCenters = gridCenters; // 나중에 사용할 좌표 저장
-                        backend.compute_mgrs_grid(JSON.stringify(mgrsRequests));
-
-                        // MGRS 데이터가 준비될 때까지 대기
-                        setTimeout(function() {{
-                            addMGRSLabels(gridCenters);
-                        }}, 100);
+                        window.pendingGridKey = gridKey;
+                        backend.compute_mgrs_grid(JSON.stringify(mgrsRequests), gridKey);
                     }}
 
-                    // FeatureGroup으로 그룹화
-                    mgrsGridLayer = L.featureGroup(lines);
-                    mgrsGridLayer.addTo(map);
-
                     // 맵 이동/줌 시 그리드 자동 업데이트
                     if (mgrsGridVisible) {{
                         map.off('zoomend moveend', updateMGRSGridIfVisible);
                         map.on('zoomend moveend', updateMGRSGridIfVisible);
+                        map.off('movestart zoomstart', fadeMGRSGrid);
+                        map.on('movestart zoomstart', fadeMGRSGrid);
                     }}
                 }}
 
+                // 이전에 만든 격자선 폴리라인을 재사용해 좌표만 갱신 (다시 그릴 때마다 새로 만들지 않음)
+                function syncMGRSGridLines(segments) {{
+                    if (!mgrsGridLayer) {{
+                        mgrsGridLayer = L.featureGroup().addTo(map);
+                    }}
+                    for (var k = 0; k < segments.length; k++) {{
+                        if (k < mgrsGridLines.length) {{
+                            mgrsGridLines[k].setLatLngs(segments[k]);
+                        }} else {{
+                            var line = L.polyline(segments[k], {{
+                                renderer: canvasRenderer,
+                                color: '#00ff00',
+                                weight: 1.5,
+                                opacity: 0.6,
+                                dashArray: '5, 5'
+                            }});
+                            mgrsGridLines.push(line);
+                            mgrsGridLayer.addLayer(line);
+                        }}
+                    }}
+                    while (mgrsGridLines.length > segments.length) {{
+                        mgrsGridLayer.removeLayer(mgrsGridLines.pop());
+                    }}
+                    // fadeMGRSGrid로 흐려진 기존 선의 투명도 복원
+                    mgrsGridLayer.setStyle({{ opacity: 0.6 }});
+                }}
+
+                // 그리드 셀 중심은 간격과 첫/마지막 격자선으로 결정되므로 이를 캐시 키로 사용
+                function mgrsGridCacheKey(gridSpacing, latLines, lonLines) {{
+                    if (latLines.length < 2 || lonLines.length < 2) return '';
+                    return gridSpacing + '|' + latLines[0] + '|' + latLines[latLines.length - 1] +
+                        '|' + lonLines[0] + '|' + lonLines[lonLines.length - 1];
+                }}
+
+                function cacheMGRSGridData(gridKey, data) {{
+                    window.mgrsGridData = data;
+                    if (!gridKey) return;
+                    if (!mgrsGridCache[gridKey]) {{
+                        if (mgrsGridCacheSize >= MGRS_GRID_CACHE_MAX) {{
+                            mgrsGridCache = {{}};
+                            mgrsGridCacheSize = 0;
+                        }}
+                        mgrsGridCacheSize++;
+                    }}
+                    mgrsGridCache[gridKey] = data;
+                }}
+
+                // Python 작업 스레드의 변환 결과 수신: 캐시에 저장하고 현재 그리드의 응답이면 라벨 표시
+                window.receiveMGRSGridData = function(gridKey, data) {{
+                    cacheMGRSGridData(gridKey, data);
+                    if (mgrsGridVisible && gridKey === window.pendingGridKey) {{
+                        addMGRSLabels(window.pendingGridCenters);
+                    }}
+                }};
+
                 function addMGRSLabels(gridCenters) {{
-                    gridCenters.forEach(function(center) {{
+                    var n = gridCenters.length;
+                    var labels = {{ lats: new Float64Array(n), lons: new Float64Array(n), texts: new Array(n) }};
+
+                    for (var i = 0; i < n; i++) {{
+                        var center = gridCenters[i];
                         var key = center.lat.toFixed(3) + '_' + center.lon.toFixed(3);
-                        var mgrsCoord = '';
+                        var mgrsCoord;
 
                         if (window.mgrsGridData && window.mgrsGridData[key]) {{
                             mgrsCoord = window.mgrsGridData[key];
                         }} else {{
                             // 폴백: 위경도 표시
-                            
-                            Coord = Math.round(center.lat * 100) / 100 + '° / ' + Math.round(center.lon * 100) / 100 + '°';
+                            mgrsCoord = Math.round(center.lat * 100) / 100 + '° / ' + Math.round(center.lon * 100) / 100 + '°';
                         }}
 
-                        var marker = L.marker([center.lat, center.lon], {{
-                            icon: L.divIcon({{
-                                className: 'mgrs-grid-label',
-                                html: mgrsCoord,
-                                iconSize: null
-                            }})
-                        }}).addTo(map);
-                        mgrsLabels.push(marker);
-                    }});
+                        labels.lats[i] = center.lat;
+                        labels.lons[i] = center.lon;
+                        labels.texts[i] = mgrsCoord;
+                    }}
+
+                    if (mgrsLabelLayer) {{
+                        mgrsLabelLayer.setLabels(labels);
+                    }} else {{
+                        mgrsLabelLayer = new MgrsLabelCanvasLayer(labels);
+                    }}
+                    if (mgrsGridVisible && !map.hasLayer(mgrsLabelLayer)) {{
+                        mgrsLabelLayer.addTo(map);
+                    }}
                 }};
 
                 window.addMGRSLabelsToGrid = addMGRSLabels;
 
+                // 연속된 zoomend/moveend는 마지막 이벤트 150ms 뒤 다음 프레임에 한 번만 다시 그림
                 function updateMGRSGridIfVisible() {{
-                    if (mgrsGridVisible) {{
-                        drawMGRSGrid();
+                    if (!mgrsGridVisible) return;
+                    clearTimeout(mgrsGridRedrawTimer);
+                    mgrsGridRedrawTimer = setTimeout(function() {{
+                        requestAnimationFrame(function() {{
+                            if (mgrsGridVisible) {{
+                                drawMGRSGrid();
+                            }}
+                        }});
+                    }}, MGRS_GRID_REDRAW_DELAY_MS);
+                }}
+
+                // 이동/줌 중에는 이전 격자를 흐리게 표시 (다시 그릴 때까지 떨림 방지)
+                function fadeMGRSGrid() {{
+                    if (mgrsGridLayer) {{
+                        mgrsGridLayer.setStyle({{ opacity: 0.1 }});
                     }}
                 }}
 
@@ -1508,11 +2710,15 @@ class TacticalMapView(QWebEngineView):
                     if (mgrsGridLayer) {{
                         map.removeLayer(mgrsGridLayer);
                         mgrsGridLayer = null;
+                        mgrsGridLines = [];
                     }}
                     // 모든 라벨 제거
-                    mgrsLabels.forEach(label => map.removeLayer(label));
-                    mgrsLabels = [];
+                    if (mgrsLabelLayer) {{
+                        map.removeLayer(mgrsLabelLayer);
+                    }}
                     map.off('zoomend moveend', updateMGRSGridIfVisible);
+                    map.off('movestart zoomstart', fadeMGRSGrid);
+                    clearTimeout(mgrsGridRedrawTimer);
                 }}
             </script>
         </body>
@@ -1525,42 +2731,56 @@ class TacticalMapView(QWebEngineView):
         if not self.is_map_ready:
             return
 
-        waypoints_json = json.dumps([wp.to_dict() for wp in mission.waypoints])
-
-        # 군사 기호 SVG 갱신
-        symbols = {}
+        # 웨이포인트 직렬화 데이터와 작업 코드를 한 번의 순회로 생성
+        wire_rows = []
+        task_codes = set()
         for wp in mission.waypoints:
-            svg = MilitarySymbolGenerator.create_svg(wp.task_code)
-            svg_b64 = base64.b64encode(svg.encode()).decode()
-            symbols[wp.wp_id] = f"data:image/svg+xml;base64,{svg_b64}"
-
-        symbols_json = json.dumps(symbols)
-
-        # MGRS 정보 생성
-        mgrs_data = {}
-        for wp in mission.waypoints:
-            mgrs_coord = MGRSConverter.lat_lon_to_mgrs(wp.lat, wp.lon)
-            mgrs_data[wp.wp_id] = mgrs_coord
-
-        mgrs_data_json = json.dumps(mgrs_data)
-
-        fit_bounds_js = "true" if fit_bounds else "false"
-        js_code = f"refreshMap({waypoints_json}, {symbols_json}, {fit_bounds_js}); window.mgrsData = {mgrs_data_json};"
-        self.page().runJavaScript(js_code)
+            wire_rows.append(wp.to_wire())
+            task_codes.add(wp.task_code)
+
+        # 군사 기호 아이콘 URL 갱신 (작업 코드별로 한 번만 전송)
+        get_icon_url = MilitarySymbolGenerator.get_icon_url
+        symbols = {code: get_icon_url(code) for code in task_codes}
+
+        # 하나의 객체 리터럴로 묶어 전달 (JS 측 파싱/마샬링 1회)
+        payload = {
+            'waypoints': wire_rows,
+            'symbols': symbols,
+            'fitBounds': bool(fit_bounds),
+        }
+        payload_json = _dumps_compact(payload)
+        self.page().runJavaScript(f"refreshMapPayload({payload_json});")
         
         # 미션 정보 업데이트
         self.update_mission_info_on_map(mission)
 
+    def refresh_waypoint_delta(self, mission: Mission, index: int):
+        """웨이포인트 하나만 이동했을 때의 부분 갱신 (전체 refresh_map 대신 사용)
+
+        이동한 지점의 좌표와, 거리가 바뀌는 앞뒤 구간(index, index + 1)만 전송한다.
+        """
+        if not self.is_map_ready:
+            return
+
+        waypoints = mission.waypoints
+        wp = waypoints[index]
+        delta = {
+            'index': index,
+            'id': wp.wp_id,
+            'lat': quantize(wp.lat, COORD_DECIMALS),
+            'lon': quantize(wp.lon, COORD_DECIMALS),
+            'distances': [[i, waypoints[i].distance] for i in (index, index + 1) if i < len(waypoints)],
+        }
+        delta_json = json.dumps(delta, separators=(',', ':'))
+        self.page().runJavaScript(f"updateWaypointDelta({delta_json});")
+
     @pyqtSlot()
     def on_map_ready(self):
         """JS에서 맵 초기화 완료 시 호출"""
         self.is_map_ready = True
-        # GeoJSON 레이어 로드
-        self.load_geojson_layers()
-        # GeoJSON 레이어 로드 완료 시그널 발생
-        self.geojson_layers_loaded.emit()
         if self.current_mission:
             self.refresh_map(self.current_mission, fit_bounds=True)
+        self.map_ready.emit()
 
     @pyqtSlot(float, float)  # JS에서 위도, 경도를 인자로 보냄
     def on_map_click(self, lat, lon):
@@ -1634,141 +2854,128 @@ class TacticalMapView(QWebEngineView):
             return self.compass_visible
         return False
 
-    @pyqtSlot(str)
-    def compute_mgrs_grid(self, grid_points_json):
-        """JavaScript에서 MGRS 변환 요청을 받아 처리"""
+    @pyqtSlot(str, str)
+    def compute_mgrs_grid(self, grid_points_json, grid_key):
+        """JavaScript에서 MGRS 변환 요청을 받아 작업 스레드에서 처리 (grid_key로 JS 측에 결과 캐시)"""
         try:
             grid_points = json.loads(grid_points_json)
-            mgrs_grid_data = {}
-
-            for point in grid_points:
-                lat = point['lat']
-                lon = point['lon']
-                mgrs_coord = MGRSConverter.lat_lon_to_mgrs(lat, lon)
-                key = f"{lat:.3f}_{lon:.3f}"
-                mgrs_grid_data[key] = mgrs_coord
-
-            # 결과를 JavaScript로 전달
-            mgrs_grid_json = json.dumps(mgrs_grid_data)
-            self.page().runJavaScript(f"window.mgrsGridData = {mgrs_grid_json};")
+            coords = [(point['lat'], point['lon']) for point in grid_points]
+            self._mgrs_pool.start(_MgrsGridTask(self, coords, grid_key))
         except Exception as e:
             print(f"MGRS 그리드 변환 오류: {str(e)}")
 
-    @pyqtSlot(float, float, str)
+    def _deliver_mgrs_grid(self, grid_key, mgrs_grid_json):
+        """작업 스레드의 MGRS 그리드 변환 결과를 JavaScript로 전달 (GUI 스레드)"""
+        if not self.is_map_ready:
+            return
+        self.page().runJavaScript(
+            f"receiveMGRSGridData({json.dumps(grid_key)}, {mgrs_grid_json});"
+        )
+
+    @pyqtSlot(float, float, float)
     def convert_single_mgrs(self, lat, lon, cache_key):
-        """단일 좌표의 MGRS 변환 (마우스 추적용)"""
-        try:
-            mgrs_coord = MGRSConverter.lat_lon_to_mgrs(lat, lon)
-
-            # JavaScript 캐시 업데이트
-            cache_obj = {cache_key: mgrs_coord}
-            cache_json = json.dumps(cache_obj)
-            self.page().runJavaScript(f"""
-                if (!window.cachedMgrsCoords) {{
-                    window.cachedMgrsCoords = {{}};
-                }}
-                Object.assign(window.cachedMgrsCoords, {cache_json});
-                // 현재 마우스 위치와 일치하면 업데이트
-                if (coordsDisplay) {{
-                    var currentText = coordsDisplay.textContent;
-                    if (currentText.includes('계산 중...')) {{
-                        var latStr = parseFloat('{lat}').toFixed(5);
-                        var lonStr = parseFloat('{lon}').toFixed(5);
-                        coordsDisplay.textContent = `LAT: ${{latStr}} LON: ${{lonStr}} MGRS: {mgrs_coord}`;
-                    }}
-                }}
-            """)
-        except Exception as e:
-            print(f"MGRS 변환 오류: {str(e)}")
+        """단일 좌표의 MGRS 변환 요청 (마우스 추적용)
+
+        마우스를 빠르게 움직이면 요청이 연달아 오므로 MGRS_HOVER_DEBOUNCE_MS 동안 모아
+        마지막 좌표만 변환한다 (중간 좌표는 화면에 표시되지 않음).
+        """
+        self._pending_mgrs = (lat, lon, cache_key)
+        if not self._mgrs_hover_timer.isActive():
+            self._mgrs_hover_timer.start()
+
+    def _flush_single_mgrs(self):
+        """대기 중인 마지막 마우스 좌표의 MGRS 변환을 작업 스레드에 요청"""
+        if self._pending_mgrs is None:
+            return
+        lat, lon, cache_key = self._pending_mgrs
+        self._pending_mgrs = None
+        self._mgrs_pool.start(_MgrsPointTask(self, lat, lon, cache_key))
+
+    def _deliver_single_mgrs(self, cache_key, mgrs_coord):
+        """작업 스레드의 마우스 위치 MGRS 변환 결과를 JavaScript로 전달 (GUI 스레드)"""
+        if not self.is_map_ready:
+            return
+        # JavaScript 캐시 업데이트 (현재 마우스 위치와 일치하면 표시도 갱신)
+        self.page().runJavaScript(self.MGRS_COORD_JS % {
+            'key': int(cache_key),
+            'mgrs': json.dumps(mgrs_coord),
+        })
 
     def load_geojson_layers(self):
-        """openAIP_data 디렉터리에서 GeoJSON 파일들을 로드하여 지도에 추가 (접두사 무관 오버레이)"""
-        if not self.is_map_ready:
+        """openAIP_data 디렉터리에서 GeoJSON 파일들을 로드하여 지도에 추가 (접두사 무관 오버레이)
+
+        파일 읽기/파싱은 _GeoJsonLoadTask가 작업 스레드에서 수행하고, feature 배치는 geojsonMessage로
+        QWebChannel을 거쳐 지도에 전달된다 (완료 시 geojson_layers_loaded 발생).
+        """
+        if not self.is_map_ready or self._geojson_task is not None:
             return
         
         # 현재 파일의 디렉터리를 기준으로 openAIP_data 경로 설정
         current_dir = Path(__file__).parent
         geojson_dir = current_dir / "openAIP_data"
         
-        # 지원하는 레이어 타입
-        supported_layers = ['apt', 'nav', 'obs', 'raa', 'rca']
-        
         # 디렉터리에서 GeoJSON 파일 검색 및 레이어별로 그룹화
-        layer_files = {layer: [] for layer in supported_layers}
+        layer_files = {layer: [] for layer in self.GEOJSON_LAYERS}
         
         if geojson_dir.exists():
-            # 각 레이어 타입에 대해 모든 파일 찾기
-            for layer_type in supported_layers:
-                # 디렉터리에서 패턴에 맞는 모든 파일 검색
-                for file_path in geojson_dir.glob(f'*_{layer_type}.geojson'):
+            # 디렉터리를 한 번만 읽고 '*_<레이어>.geojson(.gz)' 파일명의 접미사로 레이어 분류
+            for file_path in geojson_dir.iterdir():
+                name = file_path.name
+                if name.endswith('.gz'):
+                    name = name[:-len('.gz')]  # gzip 압축본은 읽을 때 압축 해제
+                if not name.endswith('.geojson'):
+                    continue
+                _, sep, layer_type = name[:-len('.geojson')].rpartition('_')
+                if sep and layer_type in layer_files:
                     layer_files[layer_type].append(file_path)
         
         # 사용 가능한 레이어 목록 저장
         self.available_layers = set()
-        
-        # 전체 파일 수 계산
-        total_files = sum(len(files) for files in layer_files.values())
-        loaded_count = 0
-        
-        for layer_key, file_paths in layer_files.items():
-            if not file_paths:
-                continue
-            
-            # 현재 레이어의 모든 파일을 병합
-            merged_geojson = {
-                'type': 'FeatureCollection',
-                'features': []
-            }
-            
-            for file_path in file_paths:
-                loaded_count += 1
-                
-                # 스플래시 화면이 있으면 진행률 업데이트
-                try:
-                    if hasattr(self, 'splash') and self.splash:
-                        self.splash.update_geojson_progress(loaded_count, total_files, file_path.name)
-                except:
-                    pass
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        geojson_data = json.load(f)
-                    
-                    # features 배열이 있으면 모두 병합
-                    if 'features' in geojson_data:
-                        merged_geojson['features'].extend(geojson_data['features'])
-                    
-                    print(f"GeoJSON 데이터 로드: {file_path.name}")
-                except Exception as e:
-                    print(f"GeoJSON 로드 오류 ({file_path.name}): {str(e)}")
-            
-            # 병합된 데이터가 있으면 지도에 추가
-            if merged_geojson['features']:
-                try:
-                    geojson_json = json.dumps(merged_geojson)
-                    self.page().runJavaScript(f"addGeoJsonLayer('{layer_key}', {geojson_json});")
-                    self.available_layers.add(layer_key)
-                    print(f"GeoJSON 레이어 로드 완료: {layer_key} ({len(merged_geojson['features'])}개 feature)")
-                except Exception as e:
-                    print(f"GeoJSON 레이어 추가 오류 ({layer_key}): {str(e)}")
-        
+        task = _GeoJsonLoadTask(layer_files, self.GEOJSON_CHUNK_SIZE, self.GEOJSON_PREFETCH_FILES)
+        task.signals.progress.connect(self._on_geojson_progress)
+        # 시그널 간 연결: 인자를 Python 객체로 되돌리지 않고 GUI 스레드에서 geojsonMessage로 재발생
+        task.signals.message.connect(self.geojsonMessage)
+        task.signals.layer_done.connect(self._on_geojson_layer_done)
+        task.signals.finished.connect(self._on_geojson_load_finished)
+        self._geojson_task = task
+        self._thread_pool.start(task)
+
+    def cancel_geojson_loading(self):
+        """진행 중인 GeoJSON 로드 작업 취소 (창 종료 시 호출)"""
+        if self._geojson_task is not None:
+            self._geojson_task.cancel()
+
+    def _on_geojson_progress(self, current, total, filename):
+        # 스플래시 화면이 있으면 진행률 업데이트
+        try:
+            if self.splash:
+                self.splash.update_geojson_progress(current, total, filename)
+        except:
+            pass
+
+    def _on_geojson_layer_done(self, layer_key, feature_count):
+        if feature_count:
+            self.available_layers.add(layer_key)
+            print(f"GeoJSON 레이어 로드 완료: {layer_key} ({feature_count}개 feature)")
+
+    def _on_geojson_load_finished(self):
+        self._geojson_task = None
+
         # 로드되지 않은 레이어 확인
-        unloaded_layers = set(supported_layers) - self.available_layers
+        unloaded_layers = set(self.GEOJSON_LAYERS) - self.available_layers
         if unloaded_layers:
             print(f"다음 레이어는 로드되지 않음: {', '.join(unloaded_layers)}")
-    
+
+        # GeoJSON 레이어 로드 완료 시그널 발생
+        self.geojson_layers_loaded.emit()
+
     def update_mission_info_on_map(self, mission: Mission):
         """지도 위에 미션 정보 업데이트"""
         if not self.is_map_ready:
             return
         
-        # 웨이포인트 간 거리 계산
-        total_distance = sum(wp.distance for wp in mission.waypoints)
-        
-        # 평균 속도 계산
-        avg_speed = 0
-        if len(mission.waypoints) > 0:
-            avg_speed = sum(wp.speed for wp in mission.waypoints) / len(mission.waypoints)
+        # 총 거리 / 평균 속도 계산
+        total_distance, avg_speed = mission.totals()
         
         # 비행시간 계산
         flight_hours = 0
@@ -1779,17 +2986,25 @@ class TacticalMapView(QWebEngineView):
             flight_minutes = int((flight_hours_total - flight_hours) * 60)
         
         # JavaScript로 미션 정보 업데이트
-        mission_data = {
-            'mission_name': mission.mission_name,
-            'waypoint_count': len(mission.waypoints),
-            'total_distance': total_distance,
-            'avg_speed': avg_speed,
-            'flight_hours': flight_hours,
-            'flight_minutes': flight_minutes
-        }
-        
-        mission_data_json = json.dumps(mission_data)
-        self.page().runJavaScript(f"updateMissionInfo({mission_data_json});")
+        self.page().runJavaScript(self.MISSION_INFO_JS % {
+            'name': json.dumps(mission.mission_name),
+            'count': len(mission.waypoints),
+            'distance': total_distance,
+            'speed': avg_speed,
+            'hours': flight_hours,
+            'minutes': flight_minutes,
+        })
+
+
+# ============================================================================
+# 공용 위젯 스타일시트
+# ============================================================================
+
+# 여러 위젯이 반복 사용하는 스타일시트 (호출마다 문자열을 새로 만들지 않고 같은 상수를 공유)
+PRIMARY_BUTTON_QSS = "background-color: #00d1b2; color: #121212; border: none;"
+SECONDARY_BUTTON_QSS = "background-color: #2c2c2c; color: #e0e0e0; border: 1px solid #3d3d3d;"
+MUTED_LABEL_QSS = "color: #b0b0b0;"
+ACCENT_LABEL_QSS = "font-weight: bold; color: #00d1b2;"
 
 
 # ============================================================================
@@ -1836,7 +3051,7 @@ class WaypointEditDialog(QDialog):
         btn_text = self.loc.get_text("main.button.convert") if self.loc else "변환"
         phonetic_btn = QPushButton(btn_text)
         phonetic_btn.setMaximumWidth(60)
-        phonetic_btn.setStyleSheet("background-color: #00d1b2; color: #121212; border: none;")
+        phonetic_btn.setStyleSheet(PRIMARY_BUTTON_QSS)
         phonetic_btn.clicked.connect(self.convert_to_phonetic)
         phonetic_layout.addWidget(phonetic_btn)
         label = self.loc.get_text("main.label.nato_phonetic") if self.loc else "NATO PHONETIC"
@@ -1854,8 +3069,7 @@ class WaypointEditDialog(QDialog):
         form.addRow(label, self.lon_input)
 
         # MGRS 좌표 (읽기 전용)
-        mgrs_coord = MGRSConverter.lat_lon_to_mgrs(self.waypoint.lat, self.waypoint.lon)
-        self.mgrs_input = QLineEdit(mgrs_coord)
+        self.mgrs_input = QLineEdit(self.waypoint.mgrs)
         self.mgrs_input.setReadOnly(True)
         label = self.loc.get_text("main.label.mgrs") if self.loc else "MGRS"
         form.addRow(label, self.mgrs_input)
@@ -1908,19 +3122,20 @@ class WaypointEditDialog(QDialog):
 
         btn_text = self.loc.get_text("main.button.cancel") if self.loc else "CANCEL"
         cancel_btn = QPushButton(btn_text)
-        cancel_btn.setStyleSheet("background-color: #2c2c2c; color: #e0e0e0; border: 1px solid #3d3d3d;")
+        cancel_btn.setStyleSheet(SECONDARY_BUTTON_QSS)
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         btn_text = self.loc.get_text("main.button.save") if self.loc else "SAVE"
         save_btn = QPushButton(btn_text)
-        save_btn.setStyleSheet("background-color: #00d1b2; color: #121212; border: none;")
+        save_btn.setStyleSheet(PRIMARY_BUTTON_QSS)
         save_btn.clicked.connect(self.save_waypoint)
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
         self.setLayout(layout)
 
+    @pyqtSlot()
     def delete_waypoint(self):
         dialog_title = self.loc.get_text("main.dialog.confirm") if self.loc else "확인"
         msg_text = self.loc.get_text("main.dialog.delete_confirm") if self.loc else "정말 삭제하시겠습니까?"
@@ -1929,6 +3144,7 @@ class WaypointEditDialog(QDialog):
             self.result = 'delete'
             self.accept()
 
+    @pyqtSlot()
     def save_waypoint(self):
         self.waypoint.name = self.name_input.text().strip() or ""
         self.waypoint.alt = float(self.alt_input.value())
@@ -1938,6 +3154,7 @@ class WaypointEditDialog(QDialog):
         self.result = 'save'
         self.accept()
 
+    @pyqtSlot()
     def convert_to_phonetic(self):
         """Convert waypoint name to NATO phonetic alphabet."""
         name = self.name_input.text().strip()
@@ -1959,23 +3176,71 @@ class WaypointListWidget(QWidget):
         self.layout = QVBoxLayout(self)
         self.list_widget = QListWidget(self)
         self.layout.addWidget(self.list_widget)
+        self._last_texts = []  # 현재 리스트에 표시 중인 행 문자열
 
     def update_waypoints(self, waypoints: List[Waypoint]):
         """Update the list widget with waypoint details."""
-        self.list_widget.clear()
-        for i, wp in enumerate(waypoints):
-            wp_name = wp.name if wp.name else f"Waypoint {i + 1}"
-            distance_text = f" | {wp.distance}km" if wp.distance > 0 else ""
-            wp_text = f"[{i + 1:02d}] {wp_name} | 속도 {wp.speed}km/h | ETA {wp.eta}{distance_text}"
-            item = QListWidgetItem(wp_text)
-            self.list_widget.addItem(item)
+        row_text = self._row_text
+        new_texts = [row_text(i, wp.name, wp.speed, wp.eta, wp.distance) for i, wp in enumerate(waypoints)]
+
+        # 기존 항목은 재사용하고 바뀐 행만 텍스트 갱신, 늘어난/줄어든 행만 추가/제거
+        old_texts = self._last_texts
+        list_widget = self.list_widget
+        list_widget.setUpdatesEnabled(False)
+        try:
+            for i in range(min(len(old_texts), len(new_texts))):
+                if old_texts[i] != new_texts[i]:
+                    list_widget.item(i).setText(new_texts[i])
+            for text in new_texts[len(old_texts):]:
+                list_widget.addItem(QListWidgetItem(text))
+            for i in range(len(old_texts) - 1, len(new_texts) - 1, -1):
+                list_widget.takeItem(i)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+        self._last_texts = new_texts
+
+    @staticmethod
+    @lru_cache(maxsize=4096, typed=True)  # 50과 50.0은 표시가 다르므로 타입별로 구분
+    def _row_text(index: int, name: str, speed: float, eta: Optional[str], distance: float) -> str:
+        """리스트 행 문자열 (표시 값이 같으면 이전에 만든 문자열 재사용)"""
+        wp_name = name if name else f"Waypoint {index + 1}"
+        distance_text = f" | {distance}km" if distance > 0 else ""
+        return f"[{index + 1:02d}] {wp_name} | 속도 {speed}km/h | ETA {eta}{distance_text}"
 
 
 # ============================================================================
 # 메인 윈도우
 # ============================================================================
 
+class _MissionLoadTask(QRunnable):
+    """저장된 미션 불러오기 작업 (QThreadPool 작업 스레드에서 실행)
+
+    결과는 window.missions_loaded 시그널로 보내며, 큐 연결을 통해 GUI 스레드에서 처리된다.
+    db.conn은 GUI 스레드 전용이므로, 짧게 쓰는 읽기용 연결을 따로 열어 WAL 스냅샷에서 읽는다
+    (GUI 스레드의 save_mission 트랜잭션 중간 상태를 읽지 않음).
+    """
+
+    def __init__(self, window, db):
+        super().__init__()
+        self.window = window
+        self.db = db
+
+    def run(self):
+        try:
+            conn = sqlite3.connect(self.db.db_path)
+            try:
+                missions = self.db.load_missions(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"미션 로드 오류: {str(e)}")
+            missions = []
+        self.window.missions_loaded.emit(missions)
+
+
 class DARTMainWindow(QMainWindow):
+    missions_loaded = pyqtSignal(list)  # 저장된 미션 목록 (작업 스레드 → GUI 스레드)
+
     def __init__(self, splash=None, localization_manager=None):
         super().__init__()
         self.splash = splash
@@ -2010,6 +3275,8 @@ class DARTMainWindow(QMainWindow):
             msg = self.loc.get_text("main.status.loading_missions") if self.loc else "미션 데이터 로딩..."
             self.splash.set_progress(0.7, msg)
         
+        # 미션 조회는 작업 스레드에서 진행하고, 창은 빈 탭으로 먼저 표시 (완료 시 탭 추가)
+        self.missions_loaded.connect(self.on_missions_loaded)
         self.load_missions()
 
         if self.splash:
@@ -2024,13 +3291,21 @@ class DARTMainWindow(QMainWindow):
         if hasattr(self.db, 'mission_updated'):
             self.db.mission_updated.connect(self.on_mission_updated)
         
-        # GeoJSON 로딩은 지도가 준비된 후에
-        QTimer.singleShot(100, self.delayed_geojson_loading)
+        # GeoJSON 로딩은 지도가 준비된 후에 (JS 콜백이 끝난 뒤 이벤트 루프에서 처리)
+        self.map_view.map_ready.connect(self.delayed_geojson_loading, Qt.QueuedConnection)
     
+    @pyqtSlot()
     def delayed_geojson_loading(self):
-        """지도가 준비된 후 GeoJSON 데이터를 로딩"""
-        if hasattr(self, 'map_view') and hasattr(self.map_view, 'load_geojson_layers'):
-            self.map_view.load_geojson_layers()
+        """지도가 준비된 후 GeoJSON 데이터를 로딩 (작업 스레드에서 진행, 완료 시 geojson_layers_loaded 시그널 발생)"""
+        self.map_view.load_geojson_layers()
+
+    def closeEvent(self, event):
+        # 로드 중인 GeoJSON 작업을 멈춰 종료 시 전역 풀이 전체 파싱을 기다리지 않도록 함
+        self.map_view.cancel_geojson_loading()
+        # 미션 로드 작업까지 끝난 뒤 연결을 닫아 WAL(-wal/-shm)을 체크포인트
+        QThreadPool.globalInstance().waitForDone()
+        self.db.close()
+        super().closeEvent(event)
 
     def apply_modern_style(self):
         self.setStyleSheet("""
@@ -2088,6 +3363,49 @@ class DARTMainWindow(QMainWindow):
                 border-color: #00d1b2;
             }
 
+            /* HUD Toggle Buttons (켜짐 상태는 active 동적 속성으로 전환) */
+            QPushButton#hudToggleButton, QPushButton#hudZoneToggleButton {
+                background-color: #333333;
+                color: #e0e0e0;
+                border: 1px solid #444444;
+                border-radius: 4px;
+                padding: 4px 8px;
+            }
+            QPushButton#hudToggleButton:hover {
+                background-color: #444444;
+                border-color: #00d1b2;
+            }
+            QPushButton#hudToggleButton:pressed {
+                background-color: #00d1b2;
+                color: #121212;
+            }
+            QPushButton#hudZoneToggleButton:hover {
+                background-color: #444444;
+                border-color: #ff0000;
+            }
+            QPushButton#hudZoneToggleButton:pressed {
+                background-color: #ff0000;
+                color: #ffffff;
+            }
+            QPushButton#hudToggleButton[active="true"] {
+                background-color: #00d1b2;
+                color: #121212;
+                border: 1px solid #00d1b2;
+                font-weight: bold;
+            }
+            QPushButton#hudToggleButton[active="true"]:hover {
+                background-color: #00b89c;
+            }
+            QPushButton#hudZoneToggleButton[active="true"] {
+                background-color: #ff0000;
+                color: #ffffff;
+                border: 1px solid #ff0000;
+                font-weight: bold;
+            }
+            QPushButton#hudZoneToggleButton[active="true"]:hover {
+                background-color: #cc0000;
+            }
+
             /* Inputs */
             QLineEdit, QSpinBox, QComboBox, QTextEdit {
                 background-color: #2a2a2a;
@@ -2121,6 +3439,19 @@ class DARTMainWindow(QMainWindow):
                 outline: none;
             }
 
+            /* HUD GeoJSON Layer Combo */
+            QComboBox#geojsonLayerCombo {
+                color: #e0e0e0;
+                padding: 4px 8px;
+                font-size: 9px;
+            }
+            QComboBox#geojsonLayerCombo:hover {
+                border-color: #00d1b2;
+            }
+            QComboBox#geojsonLayerCombo QAbstractItemView {
+                padding: 4px;
+            }
+
             /* Tabs */
             QTabWidget::pane {
                 border: 1px solid #333333;
@@ -2235,6 +3566,7 @@ class DARTMainWindow(QMainWindow):
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
 
+    @pyqtSlot()
     def toggle_waypoint_list(self):
         """웨이포인트 리스트 위젯 표시/숨김 토글"""
         is_visible = self.waypoint_list_widget.isVisible()
@@ -2247,154 +3579,42 @@ class DARTMainWindow(QMainWindow):
         else:
             self.toggle_list_btn.setText("▶ " + label_text)
 
+    @pyqtSlot()
     def toggle_mgrs_grid(self):
         """MGRS 그리드 표시/숨김 토글"""
         is_visible = self.map_view.toggle_mgrs_grid()
-        if is_visible:
-            self.mgrs_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d1b2;
-                    color: #121212;
-                    border: 1px solid #00d1b2;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #00b89c;
-                }
-            """)
-        else:
-            self.mgrs_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #333333;
-                    color: #e0e0e0;
-                    border: 1px solid #444444;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                    border-color: #00d1b2;
-                }
-                QPushButton:pressed {
-                    background-color: #00d1b2;
-                    color: #121212;
-                }
-            """)
+        self._set_toggle_active(self.mgrs_toggle_btn, is_visible)
 
+    @pyqtSlot()
     def toggle_coords_display(self):
         """좌표 표시 토글"""
         is_visible = self.map_view.toggle_coords_display()
-        if is_visible:
-            self.coords_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d1b2;
-                    color: #121212;
-                    border: 1px solid #00d1b2;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #00b89c;
-                }
-            """)
-        else:
-            self.coords_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #333333;
-                    color: #e0e0e0;
-                    border: 1px solid #444444;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                    border-color: #00d1b2;
-                }
-                QPushButton:pressed {
-                    background-color: #00d1b2;
-                    color: #121212;
-                }
-            """)
+        self._set_toggle_active(self.coords_toggle_btn, is_visible)
 
+    @pyqtSlot()
     def toggle_control_zones(self):
         """관제권 표시 토글"""
         is_visible = self.map_view.toggle_control_zone()
-        if is_visible:
-            self.control_zone_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: 1px solid #ff0000;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #cc0000;
-                }
-            """)
-        else:
-            self.control_zone_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #333333;
-                    color: #e0e0e0;
-                    border: 1px solid #444444;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                    border-color: #ff0000;
-                }
-                QPushButton:pressed {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                }
-            """)
+        self._set_toggle_active(self.control_zone_toggle_btn, is_visible)
 
+    @pyqtSlot()
     def toggle_compass(self):
         """나침반 도구 토글"""
         is_visible = self.map_view.toggle_compass()
-        if is_visible:
-            self.compass_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d1b2;
-                    color: #121212;
-                    border: 1px solid #00d1b2;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #00c9a8;
-                }
-            """)
-        else:
-            self.compass_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #333333;
-                    color: #e0e0e0;
-                    border: 1px solid #444444;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                    border-color: #00d1b2;
-                }
-                QPushButton:pressed {
-                    background-color: #00d1b2;
-                    color: #121212;
-                }
-            """)
+        self._set_toggle_active(self.compass_toggle_btn, is_visible)
+
+    @staticmethod
+    def _set_toggle_active(button, active):
+        """HUD 토글 버튼의 켜짐 상태 전환 (전역 스타일시트의 [active="true"] 규칙을 다시 적용)"""
+        button.setProperty("active", bool(active))
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
 
     def toggle_geojson_layer(self, layer_key):
         """GeoJSON 레이어 토글"""
         # 레이어 파일이 존재하는지 확인
-        if hasattr(self.map_view, 'available_layers') and layer_key not in self.map_view.available_layers:
+        if layer_key not in self.map_view.available_layers:
             QMessageBox.warning(self, "레이어 사용 불가", 
                               f"'{layer_key}' 레이어 파일이 openAIP_data 디렉터리에 존재하지 않습니다.")
             return
@@ -2402,34 +3622,47 @@ class DARTMainWindow(QMainWindow):
         is_visible = self.map_view.toggle_geojson_layer(layer_key)
         # 토글 상태에 따라 버튼 스타일 업데이트 (선택사항)
 
+    @pyqtSlot()
     def update_geojson_combo(self):
         """사용 가능한 GeoJSON 레이어만 드롭다운에 표시"""
-        if not hasattr(self.map_view, 'available_layers'):
-            return
-        
+        combo = self.geojson_layer_combo
+        available = self.map_view.available_layers
+        disabled_indexes = []
+
+        # 항목을 모두 바꾼 뒤 한 번만 다시 그리도록 시그널/화면 갱신을 잠시 중단
+        combo.blockSignals(True)
+        combo.view().setUpdatesEnabled(False)
+
         # 기존 항목 제거 (첫 번째 "GeoJSON 선택" 항목 제외)
-        while self.geojson_layer_combo.count() > 1:
-            self.geojson_layer_combo.removeItem(1)
-        
+        while combo.count() > 1:
+            combo.removeItem(1)
+
         # 사용 가능한 레이어만 추가
         for display_name, layer_key, color in self.all_geojson_layers:
-            if layer_key in self.map_view.available_layers:
-                self.geojson_layer_combo.addItem(f"{display_name} ✓", layer_key)
+            if layer_key in available:
+                combo.addItem(f"{display_name} ✓", layer_key)
             else:
-                self.geojson_layer_combo.addItem(f"{display_name} (사용불가능)", layer_key)
-                # 비활성 항목은 선택할 수 없도록 처리
-                item_index = self.geojson_layer_combo.count() - 1
-                item = self.geojson_layer_combo.model().item(item_index)
-                if item:
-                    item.setEnabled(False)
+                disabled_indexes.append(combo.count())
+                combo.addItem(f"{display_name} (사용불가능)", layer_key)
+
+        combo.view().setUpdatesEnabled(True)
+        combo.blockSignals(False)
+
+        # 비활성 항목은 선택할 수 없도록 처리
+        model = combo.model()
+        for item_index in disabled_indexes:
+            item = model.item(item_index)
+            if item:
+                item.setEnabled(False)
     
+    @pyqtSlot(int)
     def on_geojson_layer_selected(self, index):
         """드롭다운에서 GeoJSON 레이어 선택"""
         if index <= 0:  # "GeoJSON 선택" 기본값 또는 인덱스 0
             return
         
         layer_key = self.geojson_layer_combo.currentData()
-        if layer_key and hasattr(self.map_view, 'available_layers') and layer_key in self.map_view.available_layers:
+        if layer_key and layer_key in self.map_view.available_layers:
             self.toggle_geojson_layer(layer_key)
         # 선택 후 드롭다운을 기본값으로 리셋
         self.geojson_layer_combo.setCurrentIndex(0)
@@ -2458,25 +3691,25 @@ class DARTMainWindow(QMainWindow):
         # 웨이포인트 카운트
         self.hud_waypoint_label = QLabel("WP: 0")
         self.hud_waypoint_label.setFont(QFont("Segoe UI", 10))
-        self.hud_waypoint_label.setStyleSheet("color: #b0b0b0;")
+        self.hud_waypoint_label.setStyleSheet(MUTED_LABEL_QSS)
         layout.addWidget(self.hud_waypoint_label)
 
         # 총 거리
         self.hud_distance_label = QLabel("DIST: 0 km")
         self.hud_distance_label.setFont(QFont("Segoe UI", 10))
-        self.hud_distance_label.setStyleSheet("color: #b0b0b0;")
+        self.hud_distance_label.setStyleSheet(MUTED_LABEL_QSS)
         layout.addWidget(self.hud_distance_label)
 
         # 평균 속도
         self.hud_avg_speed_label = QLabel("AVG SPD: 0 km/h")
         self.hud_avg_speed_label.setFont(QFont("Segoe UI", 10))
-        self.hud_avg_speed_label.setStyleSheet("color: #b0b0b0;")
+        self.hud_avg_speed_label.setStyleSheet(MUTED_LABEL_QSS)
         layout.addWidget(self.hud_avg_speed_label)
 
         # 예상 비행시간
         self.hud_flight_time_label = QLabel("ETA: 0 h")
         self.hud_flight_time_label.setFont(QFont("Segoe UI", 10))
-        self.hud_flight_time_label.setStyleSheet("color: #b0b0b0;")
+        self.hud_flight_time_label.setStyleSheet(MUTED_LABEL_QSS)
         layout.addWidget(self.hud_flight_time_label)
 
         # 마지막 저장
@@ -2491,23 +3724,7 @@ class DARTMainWindow(QMainWindow):
         btn_text = self.loc.get_text("main.button.mgrs_grid") if self.loc else "MGRS GRID"
         self.mgrs_toggle_btn = QPushButton(btn_text)
         self.mgrs_toggle_btn.setMaximumWidth(80)
-        self.mgrs_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #e0e0e0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                border-color: #00d1b2;
-            }
-            QPushButton:pressed {
-                background-color: #00d1b2;
-                color: #121212;
-            }
-        """)
+        self.mgrs_toggle_btn.setObjectName("hudToggleButton")  # 스타일은 apply_modern_style의 전역 시트에서 적용
         self.mgrs_toggle_btn.setFont(QFont("Segoe UI", 9))
         self.mgrs_toggle_btn.clicked.connect(self.toggle_mgrs_grid)
         layout.addWidget(self.mgrs_toggle_btn)
@@ -2516,23 +3733,7 @@ class DARTMainWindow(QMainWindow):
         btn_text = self.loc.get_text("main.button.coords") if self.loc else "COORDS"
         self.coords_toggle_btn = QPushButton(btn_text)
         self.coords_toggle_btn.setMaximumWidth(100)
-        self.coords_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #e0e0e0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                border-color: #00d1b2;
-            }
-            QPushButton:pressed {
-                background-color: #00d1b2;
-                color: #121212;
-            }
-        """)
+        self.coords_toggle_btn.setObjectName("hudToggleButton")
         self.coords_toggle_btn.setFont(QFont("Segoe UI", 9))
         self.coords_toggle_btn.clicked.connect(self.toggle_coords_display)
         layout.addWidget(self.coords_toggle_btn)
@@ -2541,23 +3742,7 @@ class DARTMainWindow(QMainWindow):
         btn_text = self.loc.get_text("main.button.control_zone") if self.loc else "관제권"
         self.control_zone_toggle_btn = QPushButton(btn_text)
         self.control_zone_toggle_btn.setMaximumWidth(100)
-        self.control_zone_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #e0e0e0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                border-color: #ff0000;
-            }
-            QPushButton:pressed {
-                background-color: #ff0000;
-                color: #ffffff;
-            }
-        """)
+        self.control_zone_toggle_btn.setObjectName("hudZoneToggleButton")
         self.control_zone_toggle_btn.setFont(QFont("Segoe UI", 9))
         self.control_zone_toggle_btn.clicked.connect(self.toggle_control_zones)
         layout.addWidget(self.control_zone_toggle_btn)
@@ -2566,23 +3751,7 @@ class DARTMainWindow(QMainWindow):
         btn_text = self.loc.get_text("main.button.compass") if self.loc else "Compass"
         self.compass_toggle_btn = QPushButton(btn_text)
         self.compass_toggle_btn.setMaximumWidth(100)
-        self.compass_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #e0e0e0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                border-color: #00d1b2;
-            }
-            QPushButton:pressed {
-                background-color: #00d1b2;
-                color: #121212;
-            }
-        """)
+        self.compass_toggle_btn.setObjectName("hudToggleButton")
         self.compass_toggle_btn.setFont(QFont("Segoe UI", 9))
         self.compass_toggle_btn.clicked.connect(self.toggle_compass)
         layout.addWidget(self.compass_toggle_btn)
@@ -2604,39 +3773,7 @@ class DARTMainWindow(QMainWindow):
         for display_name, layer_key, color in self.all_geojson_layers:
             self.geojson_layer_combo.addItem(display_name, layer_key)
         
-        self.geojson_layer_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 9px;
-            }
-            QComboBox:hover {
-                border-color: #00d1b2;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #00d1b2;
-                margin-right: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-                selection-background-color: #00d1b2;
-                selection-color: #121212;
-                border: 1px solid #444444;
-                outline: none;
-                padding: 4px;
-            }
-        """)
+        self.geojson_layer_combo.setObjectName("geojsonLayerCombo")
         self.geojson_layer_combo.setFont(QFont("Segoe UI", 9))
         self.geojson_layer_combo.currentIndexChanged.connect(self.on_geojson_layer_selected)
         layout.addWidget(self.geojson_layer_combo)
@@ -2712,10 +3849,7 @@ class DARTMainWindow(QMainWindow):
 
         def create_info_label(text, bold=False):
             lbl = QLabel(text)
-            if bold:
-                lbl.setStyleSheet("font-weight: bold; color: #00d1b2;")
-            else:
-                lbl.setStyleSheet("color: #b0b0b0;")
+            lbl.setStyleSheet(ACCENT_LABEL_QSS if bold else MUTED_LABEL_QSS)
             return lbl
 
         info_layout.addRow(create_info_label("ID:"), create_info_label(mission.mission_id))
@@ -2734,15 +3868,19 @@ class DARTMainWindow(QMainWindow):
 
         waypoint_list = QListWidget()
         waypoint_list.setAlternatingRowColors(False)
-
-        for idx, wp in enumerate(mission.waypoints):
-            color = MilitarySymbolGenerator.get_color(wp.task_code)
-            eta_display = wp.eta if wp.eta else "미설정"
-            wp_name = wp.name if wp.name else f"WP-{idx + 1:02d}"
-            item_text = f"{idx + 1:02d} | {wp_name:<12} | {wp.task_code:<8} | Alt: {int(wp.alt)}m | Speed: {wp.speed} km/h | ETA: {eta_display}"
-            item = QListWidgetItem(item_text)
-            item.setToolTip(f"Lat: {wp.lat:.5f}, Lon: {wp.lon:.5f}, Distance: {wp.distance:.2f}km")
-            waypoint_list.addItem(item)
+        waypoint_list.setUniformItemSizes(True)  # 모든 행이 한 줄 텍스트이므로 행별 크기 계산 생략
+
+        # 항목을 addItems 한 번으로 추가하고 툴팁만 따로 설정 (항목마다 레이아웃을 다시 계산하지 않음)
+        waypoints = mission.waypoints
+        waypoint_list.addItems([
+            f"{idx + 1:02d} | {wp.name or f'WP-{idx + 1:02d}':<12} | {wp.task_code:<8} | "
+            f"Alt: {int(wp.alt)}m | Speed: {wp.speed} km/h | ETA: {wp.eta or '미설정'}"
+            for idx, wp in enumerate(waypoints)
+        ])
+        for idx, wp in enumerate(waypoints):
+            waypoint_list.item(idx).setToolTip(
+                f"Lat: {wp.lat:.5f}, Lon: {wp.lon:.5f}, Distance: {wp.distance:.2f}km"
+            )
 
         layout.addWidget(waypoint_list)
         layout.addStretch()
@@ -2751,27 +3889,58 @@ class DARTMainWindow(QMainWindow):
         return widget
 
     def load_missions(self):
-        self.missions = self.db.load_missions()
-        for mission in self.missions:
-            tab = self.create_mission_tab_content(mission)
-            self.mission_tabs.addTab(tab, mission.mission_name)
+        """저장된 미션을 작업 스레드에서 불러오기 (완료 시 on_missions_loaded 호출)"""
+        QThreadPool.globalInstance().start(_MissionLoadTask(self, self.db))
 
-        if self.missions:
+    @pyqtSlot(list)
+    def on_missions_loaded(self, missions):
+        """불러온 미션을 탭 앞쪽에 추가 (로드 중에 새로 만든 미션은 뒤에 유지)"""
+        if not missions:
+            return
+        self.missions[:0] = missions
+        self.mission_tabs.blockSignals(True)
+        for index, mission in enumerate(missions):
+            # 탭 내용은 처음 선택될 때 만든다 (시작 시 모든 미션의 위젯을 생성하지 않음)
+            placeholder = QWidget()
+            placeholder.setProperty("pendingContent", True)
+            self.mission_tabs.insertTab(index, placeholder, mission.mission_name)
+        self.mission_tabs.blockSignals(False)
+
+        if self.current_mission_index >= 0:
+            # 이미 선택된 미션은 그대로 두고 인덱스만 이동
+            self.current_mission_index += len(missions)
+        else:
             self.mission_tabs.setCurrentIndex(0)
             self.on_mission_tab_changed(0)
 
+    @pyqtSlot(int)
     def on_mission_tab_changed(self, index):
         if 0 <= index < len(self.missions):
             self.current_mission_index = index
             mission = self.missions[index]
+            self.ensure_mission_tab_content(index)
             self.map_view.load_mission(mission)
             self.waypoint_list_widget.update_waypoints(mission.waypoints)  # 웨이포인트 리스트 업데이트
             self.update_hud()
             
             # 지도 위에 미션 정보 업데이트
-            if hasattr(self.map_view, 'update_mission_info_on_map'):
-                self.map_view.update_mission_info_on_map(mission)
+            self.map_view.update_mission_info_on_map(mission)
+
+    def ensure_mission_tab_content(self, index):
+        """지연 생성 대기 중인 미션 탭이면 실제 내용으로 교체"""
+        placeholder = self.mission_tabs.widget(index)
+        if placeholder is None or not placeholder.property("pendingContent"):
+            return
+        mission = self.missions[index]
+        tab = self.create_mission_tab_content(mission)
+        self.mission_tabs.blockSignals(True)
+        self.mission_tabs.removeTab(index)
+        self.mission_tabs.insertTab(index, tab, mission.mission_name)
+        self.mission_tabs.setCurrentIndex(index)
+        self.mission_tabs.blockSignals(False)
+        placeholder.deleteLater()
 
+    @pyqtSlot()
     def create_new_mission(self):
         dialog = QDialog(self)
         dialog_title = self.loc.get_text("main.dialog.create_new_mission") if self.loc else "CREATE NEW MISSION"
@@ -2825,6 +3994,7 @@ class DARTMainWindow(QMainWindow):
             self.mission_tabs.addTab(tab, mission_name)
             self.mission_tabs.setCurrentIndex(len(self.missions) - 1)
 
+    @pyqtSlot(int)
     def close_mission_tab(self, index):
         if 0 <= index < len(self.missions):
             del self.missions[index]
@@ -2844,9 +4014,15 @@ class DARTMainWindow(QMainWindow):
             QMessageBox.warning(self, warn_title, warn_msg)
             return
 
-        # 웨이포인트 1과 2를 찾기
-        wp1 = next((wp for wp in mission.waypoints if wp.wp_id == wp1_id), None)
-        wp2 = next((wp for wp in mission.waypoints if wp.wp_id == wp2_id), None)
+        # 웨이포인트 1과 2를 찾기 (wp2의 인덱스도 같은 순회에서 기록)
+        wp1 = wp2 = None
+        wp_index = -1
+        for idx, wp in enumerate(mission.waypoints):
+            if wp.wp_id == wp1_id:
+                wp1 = wp
+            if wp.wp_id == wp2_id:
+                wp2 = wp
+                wp_index = idx
 
         if not wp1 or not wp2:
             warn_title = self.loc.get_text("main.dialog.warning") if self.loc else "경고"
@@ -2860,9 +4036,6 @@ class DARTMainWindow(QMainWindow):
         mid_alt = (wp1.alt + wp2.alt) / 2
         mid_speed = (wp1.speed + wp2.speed) / 2
 
-        # wp2의 인덱스 찾기
-        wp_index = mission.waypoints.index(wp2)
-
         # NATO Phonetic 이름 생성
         nato_name = NATOPhoneticConverter.get_phonetic_for_index(wp_index)
 
@@ -2883,6 +4056,7 @@ class DARTMainWindow(QMainWindow):
         self.refresh_display()
         QMessageBox.information(self, "성공", f"웨이포인트가 {wp1.name}과 {wp2.name} 사이에 삽입되었습니다")
 
+    @pyqtSlot()
     def prompt_insert_waypoint(self):
         """웨이포인트 삽입을 위한 다이얼로그 표시"""
         mission = self.get_current_mission()
@@ -2928,13 +4102,13 @@ class DARTMainWindow(QMainWindow):
         button_layout.setSpacing(10)
 
         cancel_btn = QPushButton("취소")
-        cancel_btn.setStyleSheet("background-color: #2c2c2c; color: #e0e0e0; border: 1px solid #3d3d3d;")
+        cancel_btn.setStyleSheet(SECONDARY_BUTTON_QSS)
         cancel_btn.clicked.connect(dialog.reject)
         button_layout.addWidget(cancel_btn)
 
         insert_btn = QPushButton("삽입")
         insert_btn.setObjectName("primaryButton")
-        insert_btn.clicked.connect(lambda: dialog.accept())
+        insert_btn.clicked.connect(dialog.accept)
         button_layout.addWidget(insert_btn)
 
         layout.addLayout(button_layout)
@@ -2950,6 +4124,7 @@ class DARTMainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "경고", "유효한 웨이포인트를 선택하세요")
 
+    @pyqtSlot(float, float)
     def add_waypoint(self, lat, lon):
         mission = self.get_current_mission()
         if not mission:
@@ -2964,12 +4139,14 @@ class DARTMainWindow(QMainWindow):
         mission.waypoints.append(wp)
         self.refresh_display()
 
+    @pyqtSlot(str)
     def delete_waypoint(self, wp_id):
         mission = self.get_current_mission()
         if mission:
             mission.waypoints = [wp for wp in mission.waypoints if wp.wp_id != wp_id]
             self.refresh_display()
 
+    @pyqtSlot(str, float, str, float)
     def update_waypoint(self, wp_id, alt, task_code, speed):
         mission = self.get_current_mission()
         if mission:
@@ -2981,41 +4158,47 @@ class DARTMainWindow(QMainWindow):
                     break
             self.refresh_display()
 
+    @pyqtSlot(str, float, float)
     def moved_waypoint(self, wp_id, lat, lon):
         mission = self.get_current_mission()
         if mission:
-            for wp in mission.waypoints:
+            for idx, wp in enumerate(mission.waypoints):
                 if wp.wp_id == wp_id:
                     wp.lat = lat
                     wp.lon = lon
-                    break
+                    # 드래그 이동은 해당 지점만 지도에 부분 갱신
+                    self.refresh_display(moved_index=idx)
+                    return
             self.refresh_display()
 
-    def refresh_display(self):
+    def refresh_display(self, moved_index: Optional[int] = None):
         mission = self.get_current_mission()
         if mission:
             # 웨이포인트 간의 거리 계산
             self.calculate_waypoint_distances(mission)
 
-            self.map_view.refresh_map(mission)
+            if moved_index is None:
+                self.map_view.refresh_map(mission)
+            else:
+                self.map_view.refresh_waypoint_delta(mission, moved_index)
             self.update_mission_tab(mission)
             self.update_hud()
             self.waypoint_list_widget.update_waypoints(mission.waypoints)  # 웨이포인트 리스트 위젯 업데이트
             
             # 지도 위에 미션 정보 업데이트
-            if hasattr(self.map_view, 'update_mission_info_on_map'):
-                self.map_view.update_mission_info_on_map(mission)
+            self.map_view.update_mission_info_on_map(mission)
 
     def calculate_waypoint_distances(self, mission: Mission):
         """각 웨이포인트 간의 거리를 계산하고 저장"""
-        for i, wp in enumerate(mission.waypoints):
-            if i == 0:
-                wp.distance = 0.0  # 첫 번째 웨이포인트는 거리가 0
-            else:
-                prev_wp = mission.waypoints[i - 1]
-                # geopy를 사용한 거리 계산 (km)
-                dist = distance((prev_wp.lat, prev_wp.lon), (wp.lat, wp.lon)).km
-                wp.distance = round(dist, 2)
+        waypoints = mission.waypoints
+        if not waypoints:
+            return
+
+        # haversine으로 모든 구간 거리를 한 번에 계산 (km)
+        legs = leg_distances_km([wp.lat for wp in waypoints], [wp.lon for wp in waypoints])
+        waypoints[0].distance = 0.0  # 첫 번째 웨이포인트는 거리가 0
+        for wp, dist in zip(waypoints[1:], legs):
+            wp.distance = round(dist, 2)
 
     def update_mission_tab(self, mission: Mission):
         current_index = self.mission_tabs.currentIndex()
@@ -3037,13 +4220,11 @@ class DARTMainWindow(QMainWindow):
             wp_count = len(mission.waypoints)
             self.hud_waypoint_label.setText(f"WP: {wp_count}")
 
-            # 총 거리 계산
-            total_distance = sum(wp.distance for wp in mission.waypoints)
+            # 총 거리 / 평균 속도 계산
+            total_distance, avg_speed = mission.totals()
             self.hud_distance_label.setText(f"DIST: {total_distance:.1f} km")
 
-            # 평균 속도 계산
             if wp_count > 0:
-                avg_speed = sum(wp.speed for wp in mission.waypoints) / wp_count
                 self.hud_avg_speed_label.setText(f"AVG SPD: {avg_speed:.1f} km/h")
 
                 # 예상 비행시간 계산 (총거리 / 평균속도)
@@ -3086,11 +4267,13 @@ class DARTMainWindow(QMainWindow):
             self.hud_flight_time_label.setText("ETA: 0 h")
             self.hud_last_save_label.setText("SAVED: -")
 
+    @pyqtSlot()
     def save_all_missions(self):
         for mission in self.missions:
             self.db.save_mission(mission)
         QMessageBox.information(self, "완료", "모든 미션이 저장되었습니다")
 
+    @pyqtSlot()
     def export_json(self):
         mission = self.get_current_mission()
         if not mission:
@@ -3115,6 +4298,7 @@ class DARTMainWindow(QMainWindow):
 
             QMessageBox.information(self, "완료", f"저장됨: {file_path}")
 
+    @pyqtSlot()
     def export_csv(self):
         mission = self.get_current_mission()
         if not mission:
@@ -43,6 +43,9 @@ class LocalizationManager:
         # 번역 캐시
         self.translations: Dict[str, Dict[str, Any]] = {}  # {lang: {key: value}}
         
+        # 메인 번역 조회 결과 캐시 (현재 언어 기준, Fallback까지 적용된 값)
+        self._main_text_cache: Dict[str, Any] = {}  # {key: value}
+        
         # 플러그인별 번역 캐시
         self.plugin_translations: Dict[str, Dict[str, Dict[str, Any]]] = {}
         # {plugin_name: {lang: {key: value}}}
@@ -124,6 +127,8 @@ class LocalizationManager:
                     )
             
             self.translations[lang] = translations
+        
+        self._main_text_cache.clear()
     
     def load_plugin_translations(self, plugin_name: str, plugin_dir: str):
         """
@@ -181,7 +186,9 @@ class LocalizationManager:
             성공 여부
         """
         if language in self.SUPPORTED_LANGUAGES:
-            self.current_language = language
+            if language != self.current_language:
+                self.current_language = language
+                self._main_text_cache.clear()
             return True
         return False
     
@@ -229,24 +236,35 @@ class LocalizationManager:
                     return plugin_trans["en"][key]
         
         else:
-            # 메인 애플리케이션 번역 조회
-            
-            # 현재 언어로 조회
-            if self.current_language in self.translations:
-                if key in self.translations[self.current_language]:
-                    return self.translations[self.current_language][key]
-            
-            # Fallback: 한국어
-            if "ko" in self.translations and key in self.translations["ko"]:
-                return self.translations["ko"][key]
-            
-            # Fallback: 영어
-            if "en" in self.translations and key in self.translations["en"]:
-                return self.translations["en"][key]
+            # 메인 애플리케이션 번역 조회 (Fallback 결과를 키별로 캐시하여 반복 조회 시 dict 1회로 처리)
+            value = self._main_text_cache.get(key)
+            if value is None:
+                value = self._lookup_main_text(key)
+                if value is not None:
+                    self._main_text_cache[key] = value
+            if value is not None:
+                return value
         
         # 모든 Fallback 실패
         return default or key
     
+    def _lookup_main_text(self, key: str) -> Optional[Any]:
+        """메인 번역에서 현재 언어 → 한국어 → 영어 순서로 조회 (없으면 None)"""
+        # 현재 언어로 조회
+        if self.current_language in self.translations:
+            if key in self.translations[self.current_language]:
+                return self.translations[self.current_language][key]
+        
+        # Fallback: 한국어
+        if "ko" in self.translations and key in self.translations["ko"]:
+            return self.translations["ko"][key]
+        
+        # Fallback: 영어
+        if "en" in self.translations and key in self.translations["en"]:
+            return self.translations["en"][key]
+        
+        return None
+    
     def _check_permission(self, plugin_name: str, permission: str) -> bool:
         """
         플러그인의 권한 확인 (자신의 번역 읽기는 항상 가능)